@@ -19,9 +19,14 @@ setup(
     license="Apache-2.0",
     python_requires=">=3.8",
     install_requires=[
-        "httpx>=0.23.0",
+        "httpx>=0.24.0",
+        "h2>=3,<5",
         "pydantic>=2.0,<3",
         "typing-extensions>=4.5",
         "Pillow>=12.2.0",
     ],
+    extras_require={
+        "brotli": ["brotli"],
+        "fast": ["orjson>=3.6", "pybase64>=1.0", "simsimd>=6.0"],
+    },
 )
@@ -7,10 +7,17 @@ compatible with OpenAI API patterns.
 
 from .client import SynapsAI, AsyncSynapsAI
 from .types import *
-from .resources import *
+from . import resources as _resources
 
 __version__ = "0.1.0"
 __all__ = [
     "SynapsAI",
     "AsyncSynapsAI",
 ]
+
+
+def __getattr__(name):
+    # Resource classes stay importable from the package root but load lazily
+    if name in _resources._LAZY_IMPORTS:
+        return getattr(_resources, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
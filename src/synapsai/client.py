@@ -17,45 +17,172 @@ Main client classes for SynapsAI API
 """
 
 import httpx
+import gzip
+import hashlib
 import json
 import os
 import time
 import random
 import asyncio
-from typing import Optional, Dict, Any, Union, AsyncIterator, Iterator
-
-from .resources import (
-    ChatResource,
-    AsyncChatResource,
-    ImagesResource,
-    AsyncImagesResource,
-    VideosResource,
-    AsyncVideosResource,
-    EmbeddingsResource,
-    AsyncEmbeddingsResource,
-    AudioResource,
-    AsyncAudioResource,
-    CompletionsResource,
-    AsyncCompletionsResource,
-    ClassificationsResource,
-    AsyncClassificationsResource,
-    QuestionAnsweringResource,
-    AsyncQuestionAnsweringResource,
-    ModelsResource,
-    AsyncModelsResource,
-    FeatureExtractionResource,
-    AsyncFeatureExtractionResource,
-    FillMaskResource,
-    AsyncFillMaskResource,
-    RerankResource,
-    AsyncRerankResource,
-)
-from .exceptions import APIError, AuthenticationError
-from .utils import build_url
+import threading
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Optional, Dict, Any, Union, AsyncIterable, AsyncIterator, Iterable, Iterator, Tuple, List
+
+from .exceptions import APIError, AuthenticationError, RateLimitError
+from .utils import build_url, json_dumps, json_loads
 from .logging import get_logger
 
+if TYPE_CHECKING:
+    from .resources import (
+        ChatResource,
+        AsyncChatResource,
+        ImagesResource,
+        AsyncImagesResource,
+        VideosResource,
+        AsyncVideosResource,
+        EmbeddingsResource,
+        AsyncEmbeddingsResource,
+        AudioResource,
+        AsyncAudioResource,
+        CompletionsResource,
+        AsyncCompletionsResource,
+        ClassificationsResource,
+        AsyncClassificationsResource,
+        QuestionAnsweringResource,
+        AsyncQuestionAnsweringResource,
+        ModelsResource,
+        AsyncModelsResource,
+        FeatureExtractionResource,
+        AsyncFeatureExtractionResource,
+        FillMaskResource,
+        AsyncFillMaskResource,
+        RerankResource,
+        AsyncRerankResource,
+    )
+
 logger = get_logger(__name__)
 
+# JSON request bodies above this size (in bytes) are gzip-compressed when
+# request compression is enabled.
+REQUEST_COMPRESSION_THRESHOLD = 1024
+
+# Maximum number of cached GET responses kept per client.
+GET_CACHE_MAXSIZE = 128
+
+# Headers that describe the transfer encoding of the original response and must
+# not be replayed on a cached (already decoded) body.
+_UNCACHEABLE_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+# Coalesced request bodies larger than this (in bytes) are hashed on a worker thread.
+COALESCING_HASH_THREAD_THRESHOLD = 1 << 20
+
+# Only this many bytes of an error body are inspected when raising an APIError.
+ERROR_BODY_LIMIT = 4096
+
+# Error statuses that map to a more specific APIError subclass.
+_STATUS_ERRORS = {401: AuthenticationError, 429: RateLimitError}
+
+
+def _pop_sse_payloads(buffer: bytearray) -> List[bytearray]:
+    """
+    Consume all complete lines from `buffer` and return their `data:` payloads.
+
+    Incomplete trailing data is left in the buffer for the next chunk.
+    """
+    payloads = []
+    start = 0
+    while (end := buffer.find(b"\n", start)) != -1:
+        # Slice only `data:` lines, and only once; other SSE fields are skipped in place
+        if buffer.startswith(b"data:", start, end):
+            payloads.append(buffer[start + 5:end].strip())
+        start = end + 1
+    del buffer[:start]
+    return payloads
+
+
+def _take_until_done(payloads: List[bytearray]) -> Tuple[List[bytearray], bool]:
+    """Return the payloads before a `[DONE]` sentinel and whether the sentinel was seen."""
+    for i, payload in enumerate(payloads):
+        if payload == b"[DONE]":
+            return payloads[:i], True
+    return payloads, False
+
+
+def _iter_sse_batches(chunks: Iterable[bytes]) -> Iterator[List[bytearray]]:
+    """
+    Group the `data:` payloads of an SSE byte stream by network read.
+
+    Every event that arrived in the same read is yielded together; iteration stops
+    at `[DONE]`. A final line without a trailing newline is flushed at the end.
+    """
+    buffer = bytearray()
+    for chunk in chunks:
+        buffer.extend(chunk)
+        payloads, done = _take_until_done(_pop_sse_payloads(buffer))
+        if payloads:
+            yield payloads
+        if done:
+            return
+    buffer.extend(b"\n")
+    payloads, _ = _take_until_done(_pop_sse_payloads(buffer))
+    if payloads:
+        yield payloads
+
+
+async def _aiter_sse_batches(chunks: AsyncIterable[bytes]) -> AsyncIterator[List[bytearray]]:
+    """Async variant of `_iter_sse_batches`."""
+    buffer = bytearray()
+    async for chunk in chunks:
+        buffer.extend(chunk)
+        payloads, done = _take_until_done(_pop_sse_payloads(buffer))
+        if payloads:
+            yield payloads
+        if done:
+            return
+    buffer.extend(b"\n")
+    payloads, _ = _take_until_done(_pop_sse_payloads(buffer))
+    if payloads:
+        yield payloads
+
+
+def _decode_sse_payloads(payloads: List[bytearray]) -> List[Any]:
+    """JSON-decode SSE payloads, logging and skipping malformed ones."""
+    decoded = []
+    for payload in payloads:
+        try:
+            decoded.append(json_loads(payload))
+        except json.JSONDecodeError as e:
+            # Log the malformed data for debugging
+            logger.warning(f"Received malformed JSON data: {payload[:100].decode('utf-8', 'replace')}...")
+            logger.warning(f"JSON decode error: {e}")
+    return decoded
+
+
+class _LazyResource:
+    """
+    Client attribute that creates its resource handler on first access.
+
+    The handler is stored in the instance `__dict__`, which takes precedence over this
+    (non-data) descriptor, so later lookups are plain attribute reads.
+    """
+
+    def __init__(self, class_name: str):
+        self._class_name = class_name
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        from . import resources
+
+        resource = getattr(resources, self._class_name)(instance)
+        instance.__dict__[self._name] = resource
+        return resource
+
+
 class BaseClient:
     """Base client with common functionality"""
 
@@ -67,6 +194,13 @@ class BaseClient:
         max_retries: int = 1,
         headers: Optional[Dict[str, str]] = None,
         httpx_client: Optional[httpx.Client] = None,
+        compress_requests: bool = False,
+        cache_ttl: float = 60.0,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        parallel_list_inputs: bool = False,
+        embedding_cache_size: int = 0,
     ):
         """
         Initialize the client with the provided arguments.
@@ -78,6 +212,24 @@ class BaseClient:
             max_retries: Maximum number of retries for requests (>=1).
             headers: Additional headers to include in requests.
             httpx_client: Custom HTTP client to use for requests.
+            compress_requests: Gzip-compress large JSON request bodies. Only enable
+                this if the API endpoint accepts `Content-Encoding: gzip`.
+            cache_ttl: Seconds to keep cacheable GET responses (e.g. the model list)
+                in memory. Use 0 to disable caching.
+            max_connections: Maximum number of concurrent connections in the pool.
+            max_keepalive_connections: Number of idle connections kept open for reuse.
+                Raise this when fanning out many concurrent requests.
+            keepalive_expiry: Seconds an idle connection is kept open.
+            parallel_list_inputs: Send each item of a list input to the async image, text
+                and video classification endpoints as its own concurrent request and merge
+                the results. Only useful when the server does not batch list inputs itself.
+            embedding_cache_size: Number of embeddings `embeddings.similarity` keeps in an
+                in-memory LRU cache, keyed by model, request options and a hash of the text,
+                so repeated sentences are not sent again. Use 0 (the default) to disable.
+
+        Connection pooling only pays off when a single client instance is shared across
+        the program instead of creating one per request. The pool settings are ignored
+        when a custom `httpx_client` is passed.
         """
         if api_key is None:
             api_key = os.environ.get("SYNAPSAI_API_KEY")
@@ -96,6 +248,15 @@ class BaseClient:
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
+        self.compress_requests = compress_requests
+        self.cache_ttl = cache_ttl
+        self.parallel_list_inputs = parallel_list_inputs
+        self.embedding_cache_size = embedding_cache_size
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
 
         # ensure sensible value
         self.max_retries = max(1, int(max_retries))
@@ -112,19 +273,90 @@ class BaseClient:
 
         self._client = httpx_client
 
+        # endpoint -> (expires_at, status_code, headers, content)
+        self._get_cache: "OrderedDict[str, Tuple[float, int, Dict[str, str], bytes]]" = OrderedDict()
+        self._get_cache_lock = threading.Lock()
+
+    def _cache_lookup(self, key: str) -> Optional[httpx.Response]:
+        """Return a cached GET response for `key` if present and not expired."""
+        with self._get_cache_lock:
+            entry = self._get_cache.get(key)
+            if entry is None:
+                return None
+            expires_at, status_code, headers, content = entry
+            if expires_at <= time.monotonic():
+                del self._get_cache[key]
+                return None
+            self._get_cache.move_to_end(key)
+        return httpx.Response(status_code, headers=headers, content=content)
+
+    def _cache_store(self, key: str, response: httpx.Response) -> None:
+        """Cache a successful GET response, honouring the server's Cache-Control."""
+        if not 200 <= response.status_code < 300:
+            return
+
+        ttl = self.cache_ttl
+        for directive in response.headers.get("cache-control", "").lower().split(","):
+            directive = directive.strip()
+            if directive in ("no-store", "no-cache"):
+                return
+            if directive.startswith("max-age="):
+                try:
+                    ttl = float(directive[len("max-age="):])
+                except ValueError:
+                    pass
+        if ttl <= 0:
+            return
+
+        headers = {k: v for k, v in response.headers.items() if k.lower() not in _UNCACHEABLE_HEADERS}
+        with self._get_cache_lock:
+            self._get_cache[key] = (time.monotonic() + ttl, response.status_code, headers, response.content)
+            self._get_cache.move_to_end(key)
+            while len(self._get_cache) > GET_CACHE_MAXSIZE:
+                self._get_cache.popitem(last=False)
+
     def _build_request(
         self,
         **kwargs
     ) -> Dict[str, Any]:
         """Build request payload for SynapsAI API"""
-        # Filter out None values
-        filtered_kwargs = {k: v for k, v in kwargs.items() if v is not None}
+        # Filter out None values; a single pass over the already-fresh kwargs dict
+        return {k: v for k, v in kwargs.items() if v is not None}
 
-        return {
-            **filtered_kwargs
-        }
+    def _encode_json_body(self, json_data: Union[Dict[str, Any], bytes]) -> Dict[str, Any]:
+        """
+        Build the httpx keyword arguments carrying a JSON request body.
+
+        The body is serialized once up front (with orjson when available); already serialized
+        `bytes` are sent as-is. Large bodies (e.g. base64 encoded images or long chat histories) are
+        gzip-compressed when `compress_requests` is enabled.
+        """
+        body = json_data if isinstance(json_data, (bytes, bytearray)) else json_dumps(json_data)
+        headers = {"Content-Type": "application/json"}
+        if self.compress_requests and len(body) > REQUEST_COMPRESSION_THRESHOLD:
+            body = gzip.compress(body, compresslevel=6)
+            headers["Content-Encoding"] = "gzip"
+        return {"content": body, "headers": headers}
+
+    @staticmethod
+    def _multipart_headers() -> Dict[str, str]:
+        """
+        Per-request headers for multipart/form-data bodies.
+
+        The client-wide Content-Type is application/json, which httpx would keep for
+        requests with `files=`. Passing an explicit boundary makes httpx encode the
+        multipart body with it.
+        """
+        return {"Content-Type": f"multipart/form-data; boundary={os.urandom(16).hex()}"}
 
     def _handle_error_response(self, response: httpx.Response) -> None:
+        """
+        Raise the exception matching an error response.
+
+        Only the first ERROR_BODY_LIMIT bytes of the body are inspected, and the body is
+        only JSON-decoded when it looks like a structured error. 401 and 429 responses
+        raise AuthenticationError and RateLimitError respectively.
+        """
         # Ensure content is loaded for streamed responses
         try:
             # If _content is missing, this will populate it
@@ -133,25 +365,38 @@ class BaseClient:
         except Exception:
             # If this fails, we still fall back to a generic message below
             pass
-    
+
         try:
-            error_data = response.json()
-            # Support the infra server structured error format:
-            if isinstance(error_data, dict) and "error" in error_data:
-                err = error_data["error"]
-                message = err.get("message") or err.get("error") or str(err)
+            raw = response.content[:ERROR_BODY_LIMIT]
+        except httpx.ResponseNotRead:
+            raw = b""
 
-                # keep original status semantics
-                raise APIError(message, status_code=response.status_code)
+        error_data = None
+        message = None
+        if b'"error"' in raw or b'"message"' in raw:
+            try:
+                error_data = json_loads(raw)
+            except ValueError:
+                # Not JSON, or truncated by the size limit
+                error_data = None
+        if isinstance(error_data, dict):
+            # Support the infra server structured error format: {"error": {"message": ...}}
+            err = error_data.get("error")
+            if isinstance(err, dict):
+                message = err.get("message") or err.get("error") or str(err)
+            elif err:
+                message = str(err)
             else:
-                # try to extract message from common patterns
-                if isinstance(error_data, dict):
-                    message = error_data.get("error", {}).get("message") or error_data.get("message") or str(error_data)
-                else:
-                    message = str(error_data)
-        except Exception:
-            message = f"HTTP {response.status_code}: {response.text}"
-        raise APIError(message, status_code=response.status_code)
+                message = error_data.get("message")
+        else:
+            error_data = None
+
+        if not message:
+            message = f"HTTP {response.status_code}: {raw[:200].decode('utf-8', 'replace')}"
+        error_cls = _STATUS_ERRORS.get(response.status_code, APIError)
+        # Never chain to whatever exception the caller may be handling: the error
+        # response is the whole story and the chained frames would be kept alive.
+        raise error_cls(message, status_code=response.status_code, response_data=error_data) from None
 
     def _should_retry(self, method: str, response: Optional[httpx.Response], exc: Optional[BaseException], attempt: int) -> bool:
         """
@@ -179,16 +424,36 @@ class BaseClient:
 
         return False
 
-    def _backoff_delay(self, attempt: int) -> float:
+    def _retry_delay(self, response: httpx.Response, prev_delay: float) -> float:
         """
-        Exponential backoff with jitter.
+        Delay before retrying a failed response.
 
-        attempt is 0-based. We use base 0.5s.
+        Honors a `Retry-After` header (seconds or HTTP-date) on 429/503 responses,
+        capped at 60s, and falls back to the jittered backoff otherwise.
+        """
+        retry_after = response.headers.get("Retry-After")
+        if retry_after and response.status_code in (429, 503):
+            retry_after = retry_after.strip()
+            try:
+                if retry_after.isdigit():
+                    delay = float(retry_after)
+                else:
+                    delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+                return min(max(delay, 0.0), 60.0)
+            except (TypeError, ValueError, OverflowError):
+                pass
+        return self._backoff_delay(prev_delay)
+
+    def _backoff_delay(self, prev_delay: float) -> float:
+        """
+        Decorrelated-jitter backoff.
+
+        prev_delay is the previous sleep of the current request (0 before the first retry).
+        Each delay is drawn from [base, 3 * prev_delay] which spreads out retries from
+        many clients better than plain exponential backoff. Base is 0.5s.
         """
         base = 0.5
-        delay = base * (2 ** attempt)
-        # add jitter up to 0.5s
-        delay += random.uniform(0, 0.5)
+        delay = random.uniform(base, max(base, prev_delay) * 3)
         # Cap delay to a sensible maximum (e.g., 30s)
         return min(delay, 30.0)
 
@@ -196,18 +461,18 @@ class BaseClient:
 class SynapsAI(BaseClient):
     """Synchronous SynapsAI client"""
 
-    chat: ChatResource
-    images: ImagesResource
-    videos: VideosResource
-    embeddings: EmbeddingsResource
-    audio: AudioResource
-    completions: CompletionsResource
-    classifications: ClassificationsResource
-    question_answering: QuestionAnsweringResource
-    models: ModelsResource
-    feature_extraction: FeatureExtractionResource
-    fill_mask: FillMaskResource
-    rerank: RerankResource
+    chat: "ChatResource" = _LazyResource("ChatResource")
+    images: "ImagesResource" = _LazyResource("ImagesResource")
+    videos: "VideosResource" = _LazyResource("VideosResource")
+    embeddings: "EmbeddingsResource" = _LazyResource("EmbeddingsResource")
+    audio: "AudioResource" = _LazyResource("AudioResource")
+    completions: "CompletionsResource" = _LazyResource("CompletionsResource")
+    classifications: "ClassificationsResource" = _LazyResource("ClassificationsResource")
+    question_answering: "QuestionAnsweringResource" = _LazyResource("QuestionAnsweringResource")
+    models: "ModelsResource" = _LazyResource("ModelsResource")
+    feature_extraction: "FeatureExtractionResource" = _LazyResource("FeatureExtractionResource")
+    fill_mask: "FillMaskResource" = _LazyResource("FillMaskResource")
+    rerank: "RerankResource" = _LazyResource("RerankResource")
 
     def __init__(self, api_key: Optional[str] = None, **kwargs):
         super().__init__(api_key=api_key, **kwargs)
@@ -216,23 +481,10 @@ class SynapsAI(BaseClient):
                 timeout=self.timeout,
                 headers=self._headers,
                 http2=True,
+                limits=self._limits,
                 verify=False,
             )
 
-        # Initialize resource handlers
-        self.chat = ChatResource(self)
-        self.images = ImagesResource(self)
-        self.videos = VideosResource(self)
-        self.embeddings = EmbeddingsResource(self)
-        self.audio = AudioResource(self)
-        self.completions = CompletionsResource(self)
-        self.classifications = ClassificationsResource(self)
-        self.question_answering = QuestionAnsweringResource(self)
-        self.models = ModelsResource(self)
-        self.feature_extraction = FeatureExtractionResource(self)
-        self.fill_mask = FillMaskResource(self)
-        self.rerank = RerankResource(self)
-
     def __enter__(self):
         return self
 
@@ -243,6 +495,18 @@ class SynapsAI(BaseClient):
         """Close the HTTP client"""
         self._client.close()
 
+    def warmup(self) -> None:
+        """
+        Open a pooled connection (TLS and HTTP/2 handshakes) ahead of the first real request.
+
+        This fetches the model list, which also fills the GET cache. Failures are logged
+        and ignored; the first real request will surface them.
+        """
+        try:
+            self._get("models", cached=True)
+        except (APIError, httpx.HTTPError) as e:
+            logger.debug(f"Connection warmup failed: {e}")
+
     def _request(
         self,
         method: str,
@@ -267,16 +531,18 @@ class SynapsAI(BaseClient):
         }
 
         if json_data:
-            base_kwargs["json"] = json_data
+            base_kwargs.update(self._encode_json_body(json_data))
         if data:
             base_kwargs["data"] = data
         if files:
             base_kwargs["files"] = files
+            base_kwargs["headers"] = self._multipart_headers()
         if stream:
             # note: for streaming we still attempt to (re)establish the stream on failures opening it
             base_kwargs["stream"] = True
 
         attempt = 0
+        delay = 0.0
         last_exc: Optional[BaseException] = None
         last_response: Optional[httpx.Response] = None
 
@@ -288,12 +554,12 @@ class SynapsAI(BaseClient):
                 # If server-side error or rate-limit, decide if retry
                 if response.status_code >= 400:
                     if self._should_retry(method, response, None, attempt) and attempt < (self.max_retries - 1):
-                        # close body and wait before retrying
+                        # release the connection without buffering the body, then wait
                         try:
-                            response.read()
+                            response.close()
                         except Exception:
                             pass
-                        delay = self._backoff_delay(attempt)
+                        delay = self._retry_delay(response, delay)
                         time.sleep(delay)
                         attempt += 1
                         continue
@@ -307,7 +573,7 @@ class SynapsAI(BaseClient):
                 last_exc = e
                 # decide if we should retry
                 if self._should_retry(method, None, e, attempt) and attempt < (self.max_retries - 1):
-                    delay = self._backoff_delay(attempt)
+                    delay = self._backoff_delay(delay)
                     time.sleep(delay)
                     attempt += 1
                     continue
@@ -331,9 +597,21 @@ class SynapsAI(BaseClient):
         """Make a POST request"""
         return self._request("POST", endpoint, json_data, data, files)
 
-    def _get(self, endpoint: str) -> httpx.Response:
-        """Make a GET request"""
-        return self._request("GET", endpoint)
+    def _get(self, endpoint: str, cached: bool = False) -> httpx.Response:
+        """
+        Make a GET request.
+
+        With `cached=True` the response is served from (and stored in) the
+        client's in-memory GET cache.
+        """
+        if not cached:
+            return self._request("GET", endpoint)
+
+        response = self._cache_lookup(endpoint)
+        if response is None:
+            response = self._request("GET", endpoint)
+            self._cache_store(endpoint, response)
+        return response
 
     def _delete(self, endpoint: str) -> httpx.Response:
         """Make a DELETE request"""
@@ -345,24 +623,33 @@ class SynapsAI(BaseClient):
         json_data: Optional[Dict[str, Any]] = None,
         data: Optional[Dict[str, Any]] = None,
         files: Optional[Dict[str, Any]] = None,
+        raw: bool = False,
+        batched: bool = False,
     ) -> Iterator[Dict[str, Any]]:
         """
         Stream response data from a POST endpoint.
 
         The attempt to establish the stream will be retried using the same backoff rules.
         Once the stream is established, streaming errors are raised as-is.
+        With `raw=True` the undecoded JSON payload (bytes) of each event is yielded.
+        With `batched=True` all events that arrived in the same network read are
+        yielded together as a list.
         """
         url = build_url(self.base_url, endpoint)
         base_kwargs = {
             "method": "POST",
             "url": url,
             "timeout": self.timeout,
-            "json": json_data,
             "data": data,
             "files": files,
         }
+        if json_data:
+            base_kwargs.update(self._encode_json_body(json_data))
+        if files:
+            base_kwargs["headers"] = self._multipart_headers()
 
         attempt = 0
+        delay = 0.0
         while attempt < self.max_retries:
             try:
                 with self._client.stream(**base_kwargs) as response:
@@ -370,39 +657,31 @@ class SynapsAI(BaseClient):
                         # decide whether to retry establishing stream
                         if self._should_retry("POST", response, None, attempt) and attempt < (self.max_retries - 1):
                             try:
-                                response.read()
+                                response.close()
                             except Exception:
                                 pass
-                            delay = self._backoff_delay(attempt)
+                            delay = self._retry_delay(response, delay)
                             time.sleep(delay)
                             attempt += 1
                             continue
                         else:
                             self._handle_error_response(response)
 
-                    # stream established, iterate lines and yield
-                    for line in response.iter_lines():
-                        line = line.strip()
-                        if not line:
-                            continue
-                        if line.startswith("data: "):
-                            data_line = line[6:]  # Remove "data: " prefix
-                            if data_line == "[DONE]":
-                                return
-                            try:
-                                yield json.loads(data_line)
-                            except json.JSONDecodeError as e:
-                                # Log the malformed data for debugging
-                                logger.warning(f"Received malformed JSON data: {data_line[:100]}...")
-                                logger.warning(f"JSON decode error: {e}")
-                                continue
+                    # stream established, split raw bytes into SSE events and yield
+                    for payloads in _iter_sse_batches(response.iter_bytes()):
+                        events = payloads if raw else _decode_sse_payloads(payloads)
+                        if batched:
+                            if events:
+                                yield events
+                        else:
+                            yield from events
                     # If stream ends naturally, return
                     return
 
             except (httpx.RequestError, httpx.TimeoutException) as e:
                 # network issue while establishing stream, maybe retry
                 if attempt < (self.max_retries - 1):
-                    delay = self._backoff_delay(attempt)
+                    delay = self._backoff_delay(delay)
                     time.sleep(delay)
                     attempt += 1
                     continue
@@ -423,18 +702,18 @@ class SynapsAI(BaseClient):
 
 class AsyncSynapsAI(BaseClient):
     """Asynchronous SynapsAI client"""
-    chat: AsyncChatResource
-    images: AsyncImagesResource
-    videos: AsyncVideosResource
-    embeddings: AsyncEmbeddingsResource
-    audio: AsyncAudioResource
-    completions: AsyncCompletionsResource
-    classifications: AsyncClassificationsResource
-    question_answering: AsyncQuestionAnsweringResource
-    models: AsyncModelsResource
-    feature_extraction: AsyncFeatureExtractionResource
-    fill_mask: AsyncFillMaskResource
-    rerank: AsyncRerankResource
+    chat: "AsyncChatResource" = _LazyResource("AsyncChatResource")
+    images: "AsyncImagesResource" = _LazyResource("AsyncImagesResource")
+    videos: "AsyncVideosResource" = _LazyResource("AsyncVideosResource")
+    embeddings: "AsyncEmbeddingsResource" = _LazyResource("AsyncEmbeddingsResource")
+    audio: "AsyncAudioResource" = _LazyResource("AsyncAudioResource")
+    completions: "AsyncCompletionsResource" = _LazyResource("AsyncCompletionsResource")
+    classifications: "AsyncClassificationsResource" = _LazyResource("AsyncClassificationsResource")
+    question_answering: "AsyncQuestionAnsweringResource" = _LazyResource("AsyncQuestionAnsweringResource")
+    models: "AsyncModelsResource" = _LazyResource("AsyncModelsResource")
+    feature_extraction: "AsyncFeatureExtractionResource" = _LazyResource("AsyncFeatureExtractionResource")
+    fill_mask: "AsyncFillMaskResource" = _LazyResource("AsyncFillMaskResource")
+    rerank: "AsyncRerankResource" = _LazyResource("AsyncRerankResource")
 
     def __init__(self, api_key: Optional[str] = None, **kwargs):
         super().__init__(api_key=api_key, **kwargs)
@@ -443,21 +722,11 @@ class AsyncSynapsAI(BaseClient):
                 timeout=self.timeout,
                 headers=self._headers,
                 http2=True,
+                limits=self._limits,
             )
 
-        # Initialize async resource handlers
-        self.chat = AsyncChatResource(self)
-        self.images = AsyncImagesResource(self)
-        self.videos = AsyncVideosResource(self)
-        self.embeddings = AsyncEmbeddingsResource(self)
-        self.audio = AsyncAudioResource(self)
-        self.completions = AsyncCompletionsResource(self)
-        self.classifications = AsyncClassificationsResource(self)
-        self.question_answering = AsyncQuestionAnsweringResource(self)
-        self.models = AsyncModelsResource(self)
-        self.feature_extraction = AsyncFeatureExtractionResource(self)
-        self.fill_mask = AsyncFillMaskResource(self)
-        self.rerank = AsyncRerankResource(self)
+        # request key -> task sending the in-flight request
+        self._inflight: Dict[str, "asyncio.Task[httpx.Response]"] = {}
 
     async def __aenter__(self):
         return self
@@ -469,6 +738,22 @@ class AsyncSynapsAI(BaseClient):
         """Close the HTTP client"""
         await self._client.aclose()
 
+    async def aclose(self):
+        """Alias of `close`, matching httpx.AsyncClient"""
+        await self.close()
+
+    async def warmup(self) -> None:
+        """
+        Open a pooled connection (TLS and HTTP/2 handshakes) ahead of the first real request.
+
+        This fetches the model list, which also fills the GET cache. Failures are logged
+        and ignored; the first real request will surface them.
+        """
+        try:
+            await self._get("models", cached=True)
+        except (APIError, httpx.HTTPError) as e:
+            logger.debug(f"Connection warmup failed: {e}")
+
     async def _request(
         self,
         method: str,
@@ -476,8 +761,62 @@ class AsyncSynapsAI(BaseClient):
         json_data: Optional[Dict[str, Any]] = None,
         data: Optional[Dict[str, Any]] = None,
         files: Optional[Dict[str, Any]] = None,
+        idempotent: bool = False,
+    ) -> httpx.Response:
+        """
+        Make an async request to the API with retries.
+
+        Identical GET requests (or requests flagged `idempotent`) that are already
+        in flight are coalesced: later callers await the first caller's response
+        instead of issuing another HTTP call.
+        """
+        if (method != "GET" and not idempotent) or data or files:
+            return await self._send_request(method, endpoint, json_data, data, files)
+
+        # Serialize once with sorted keys: the bytes are both the coalescing key and the body sent
+        body = json_dumps(json_data, sort_keys=True) if json_data else b""
+        key = await self._coalescing_key(method, endpoint, body)
+
+        task = self._inflight.get(key)
+        if task is None:
+            # The request runs as its own task so that cancelling any one caller (including
+            # the one that started it) does not cancel it for the others.
+            task = asyncio.get_running_loop().create_task(
+                self._send_request(method, endpoint, body or None, data, files)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._request_done(key, done))
+        return await asyncio.shield(task)
+
+    @staticmethod
+    async def _coalescing_key(method: str, endpoint: str, body: bytes) -> str:
+        """Hash a serialized request; large bodies (e.g. base64 images) are hashed off the event loop"""
+        digest = hashlib.blake2b(f"{method} {endpoint} ".encode("utf-8"))
+        if len(body) > COALESCING_HASH_THREAD_THRESHOLD:
+            # hashlib releases the GIL while hashing large buffers
+            await asyncio.to_thread(digest.update, body)
+        else:
+            digest.update(body)
+        return digest.hexdigest()
+
+    def _request_done(self, key: str, task: "asyncio.Task[httpx.Response]") -> None:
+        """Forget a finished coalesced request"""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Callers re-raise the error themselves; retrieve it here so a task whose callers were
+        # all cancelled does not log "exception was never retrieved".
+        if not task.cancelled():
+            task.exception()
+
+    async def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        json_data: Optional[Union[Dict[str, Any], bytes]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        files: Optional[Dict[str, Any]] = None,
     ) -> httpx.Response:
-        """Make an async request to the API with retries."""
+        """Send a single logical request, retrying on transient failures."""
         url = build_url(self.base_url, endpoint)
 
         base_kwargs: Dict[str, Any] = {
@@ -487,13 +826,15 @@ class AsyncSynapsAI(BaseClient):
         }
 
         if json_data:
-            base_kwargs["json"] = json_data
+            base_kwargs.update(self._encode_json_body(json_data))
         if data:
             base_kwargs["data"] = data
         if files:
             base_kwargs["files"] = files
+            base_kwargs["headers"] = self._multipart_headers()
 
         attempt = 0
+        delay = 0.0
         last_exc: Optional[BaseException] = None
         last_response: Optional[httpx.Response] = None
 
@@ -505,10 +846,10 @@ class AsyncSynapsAI(BaseClient):
                 if response.status_code >= 400:
                     if self._should_retry(method, response, None, attempt) and attempt < (self.max_retries - 1):
                         try:
-                            await response.aread()
+                            await response.aclose()
                         except Exception:
                             pass
-                        delay = self._backoff_delay(attempt)
+                        delay = self._retry_delay(response, delay)
                         await asyncio.sleep(delay)
                         attempt += 1
                         continue
@@ -519,7 +860,7 @@ class AsyncSynapsAI(BaseClient):
             except (httpx.RequestError, httpx.TimeoutException) as e:
                 last_exc = e
                 if self._should_retry(method, None, e, attempt) and attempt < (self.max_retries - 1):
-                    delay = self._backoff_delay(attempt)
+                    delay = self._backoff_delay(delay)
                     await asyncio.sleep(delay)
                     attempt += 1
                     continue
@@ -538,13 +879,26 @@ class AsyncSynapsAI(BaseClient):
         json_data: Optional[Dict[str, Any]] = None,
         data: Optional[Dict[str, Any]] = None,
         files: Optional[Dict[str, Any]] = None,
+        idempotent: bool = False,
     ) -> httpx.Response:
         """Make an async POST request"""
-        return await self._request("POST", endpoint, json_data, data, files)
+        return await self._request("POST", endpoint, json_data, data, files, idempotent=idempotent)
 
-    async def _get(self, endpoint: str) -> httpx.Response:
-        """Make a GET request"""
-        return await self._request("GET", endpoint=endpoint)
+    async def _get(self, endpoint: str, cached: bool = False) -> httpx.Response:
+        """
+        Make a GET request.
+
+        With `cached=True` the response is served from (and stored in) the
+        client's in-memory GET cache.
+        """
+        if not cached:
+            return await self._request("GET", endpoint=endpoint)
+
+        response = self._cache_lookup(endpoint)
+        if response is None:
+            response = await self._request("GET", endpoint=endpoint)
+            self._cache_store(endpoint, response)
+        return response
 
     async def _delete(self, endpoint: str) -> httpx.Response:
         """Make a DELETE request"""
@@ -556,12 +910,17 @@ class AsyncSynapsAI(BaseClient):
         json_data: Optional[Dict[str, Any]] = None,
         data: Optional[Dict[str, Any]] = None,
         files: Optional[Dict[str, Any]] = None,
+        raw: bool = False,
+        batched: bool = False,
     ) -> AsyncIterator[Dict[str, Any]]:
         """
         Stream response data from a POST endpoint (async).
 
         The attempt to establish the stream will be retried using the same backoff rules.
         Once the stream is established, streaming errors are raised as-is.
+        With `raw=True` the undecoded JSON payload (bytes) of each event is yielded.
+        With `batched=True` all events that arrived in the same network read are
+        yielded together as a list.
         """
         url = build_url(self.base_url, endpoint)
 
@@ -569,47 +928,50 @@ class AsyncSynapsAI(BaseClient):
             "method": "POST",
             "url": url,
             "timeout": self.timeout,
-            "json": json_data,
             "data": data,
             "files": files,
         }
+        if json_data:
+            base_kwargs.update(self._encode_json_body(json_data))
+        if files:
+            base_kwargs["headers"] = self._multipart_headers()
 
         attempt = 0
+        delay = 0.0
         while attempt < self.max_retries:
             try:
                 async with self._client.stream(**base_kwargs) as response:
                     if response.status_code >= 400:
                         if self._should_retry("POST", response, None, attempt) and attempt < (self.max_retries - 1):
                             try:
-                                await response.aread()
+                                await response.aclose()
                             except Exception:
                                 pass
-                            delay = self._backoff_delay(attempt)
+                            delay = self._retry_delay(response, delay)
                             await asyncio.sleep(delay)
                             attempt += 1
                             continue
                         else:
+                            try:
+                                await response.aread()
+                            except Exception:
+                                pass
                             self._handle_error_response(response)
 
-                    async for raw_line in response.aiter_lines():
-                        line = raw_line.strip()
-                        if not line:
-                            continue
-                        if line.startswith("data: "):
-                            data_line = line[6:]  # Remove "data: " prefix
-                            if data_line == "[DONE]":
-                                return
-                            try:
-                                yield json.loads(data_line)
-                            except json.JSONDecodeError:
-                                # skip malformed line
-                                continue
+                    async for payloads in _aiter_sse_batches(response.aiter_bytes()):
+                        events = payloads if raw else _decode_sse_payloads(payloads)
+                        if batched:
+                            if events:
+                                yield events
+                        else:
+                            for event in events:
+                                yield event
                     # stream ended normally
                     return
 
             except (httpx.RequestError, httpx.TimeoutException) as e:
                 if attempt < (self.max_retries - 1):
-                    delay = self._backoff_delay(attempt)
+                    delay = self._backoff_delay(delay)
                     await asyncio.sleep(delay)
                     attempt += 1
                     continue
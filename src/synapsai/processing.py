@@ -1,17 +1,186 @@
-from PIL import Image
-import base64
+try:
+    # SIMD-accelerated drop-in replacement for the stdlib codec (optional)
+    import pybase64 as base64
+except ImportError:
+    import base64
+import errno
+import mmap
 import os
 import io
+import sys
+import threading
+import wave
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+
+# Read size used when base64-encoding files. It is a multiple of 3 so that no
+# padding is emitted between chunks.
+_B64_CHUNK_SIZE = 3 * 64 * 1024
+
+# Files larger than this are memory-mapped for encoding instead of read block by block.
+_MMAP_THRESHOLD = 1 << 20
+
+# Strings longer than this cannot be file paths on any supported platform.
+_MAX_PATH_LENGTH = 4096
+
+def _looks_like_path(value):
+    """Cheaply rule out strings that cannot be file paths (data URLs, base64 blobs)"""
+    return (
+        len(value) <= _MAX_PATH_LENGTH
+        and not value.startswith("data:")
+        and "\n" not in value
+        and "\0" not in value
+    )
+
+# Batched inputs are processed on a small shared pool so that file reads overlap.
+_IO_POOL_MAX_WORKERS = 8
+_IO_POOL_THREAD_PREFIX = "synapsai-io"
+_io_pool = None
+_io_pool_lock = threading.Lock()
+
+def _get_io_pool():
+    """Return the shared I/O thread pool, creating it on first use"""
+    global _io_pool
+    if _io_pool is None:
+        with _io_pool_lock:
+            if _io_pool is None:
+                _io_pool = ThreadPoolExecutor(
+                    max_workers=_IO_POOL_MAX_WORKERS, thread_name_prefix=_IO_POOL_THREAD_PREFIX
+                )
+    return _io_pool
+
+def _process_batch(func, items):
+    """Apply `func` to each item of a batch, concurrently when there is more than one"""
+    # Nested lists are handled inline by the worker so they never wait on the pool
+    if len(items) < 2 or threading.current_thread().name.startswith(_IO_POOL_THREAD_PREFIX):
+        return [func(item) for item in items]
+    return list(_get_io_pool().map(func, items))
+
+# open() errors meaning "this string is not a path to a readable file"
+_NOT_A_FILE_ERRNOS = {errno.ENOENT, errno.ENOTDIR, errno.EISDIR, errno.ENAMETOOLONG, errno.EINVAL}
+
+def _open_if_file(value):
+    """Open `value` if it is a path to an existing file, else return None (one syscall, no stat)"""
+    if not _looks_like_path(value):
+        return None
+    try:
+        return open(value, "rb")
+    except OSError as e:
+        if e.errno in _NOT_A_FILE_ERRNOS:
+            return None
+        raise
+
+def _b64_data_url(fh, mime):
+    """Base64-encode a binary file object into a data URL, reading it in chunks"""
+    prefix = b"data:" + mime.encode("ascii") + b";base64,"
+    try:
+        fileno = fh.fileno()
+        start = fh.tell()
+        remaining = os.fstat(fileno).st_size - start
+    except (AttributeError, OSError, ValueError):
+        remaining = 0
+    # Size the output once when the file size is known instead of growing it per chunk
+    out = bytearray(len(prefix) + 4 * -(-max(remaining, 0) // 3))
+    out[:len(prefix)] = prefix
+    pos = len(prefix)
+    if remaining > _MMAP_THRESHOLD:
+        # Encode straight from the mapped pages, without copying each block into a bytes object
+        with mmap.mmap(fileno, 0, access=mmap.ACCESS_READ) as mm:
+            end = len(mm)
+            for offset in range(start, end, _B64_CHUNK_SIZE):
+                with memoryview(mm)[offset:offset + _B64_CHUNK_SIZE] as block:
+                    encoded = base64.b64encode(block)
+                out[pos:pos + len(encoded)] = encoded
+                pos += len(encoded)
+        fh.seek(end)
+    else:
+        carry = b""
+        while chunk := fh.read(_B64_CHUNK_SIZE):
+            if carry:
+                chunk = carry + chunk
+            # Short reads (e.g. from raw streams) may not be a multiple of 3
+            cut = len(chunk) - len(chunk) % 3
+            encoded = base64.b64encode(chunk[:cut])
+            out[pos:pos + len(encoded)] = encoded
+            pos += len(encoded)
+            carry = chunk[cut:]
+        encoded = base64.b64encode(carry)
+        out[pos:pos + len(encoded)] = encoded
+        pos += len(encoded)
+    # The file may have changed size while it was read
+    del out[pos:]
+    return out.decode("ascii")
+
+# Data URLs of recently encoded files, keyed by file identity, size and modification time so
+# that repeated calls with the same path skip the read and encode. Bounded by total length and
+# disabled until enabled with `set_file_cache_size`.
+_file_cache_max_chars = 0
+_file_cache = OrderedDict()
+_file_cache_chars = 0
+_file_cache_lock = threading.Lock()
+
+def _evict_file_cache():
+    """Drop the least recently used entries until the cache fits its size (lock held)"""
+    global _file_cache_chars
+    while _file_cache_chars > _file_cache_max_chars:
+        _, evicted = _file_cache.popitem(last=False)
+        _file_cache_chars -= len(evicted)
+
+def set_file_cache_size(max_chars):
+    """
+    Reuse the data URLs of input files given by path, keeping up to `max_chars` characters of
+    them in memory. Entries are dropped when the file changes. 0 (the default) disables the cache.
+    """
+    global _file_cache_max_chars
+    if max_chars < 0:
+        raise ValueError("max_chars must be >= 0")
+    with _file_cache_lock:
+        _file_cache_max_chars = max_chars
+        _evict_file_cache()
+
+def clear_file_cache():
+    """Drop every cached file data URL"""
+    global _file_cache_chars
+    with _file_cache_lock:
+        _file_cache.clear()
+        _file_cache_chars = 0
+
+def _file_data_url(fh, mime):
+    """`_b64_data_url` for a file opened from a path, reused while the file is unchanged"""
+    global _file_cache_chars
+    if not _file_cache_max_chars:
+        return _b64_data_url(fh, mime)
+    try:
+        st = os.fstat(fh.fileno())
+    except (AttributeError, OSError, ValueError):
+        return _b64_data_url(fh, mime)
+    key = (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns, mime)
+    with _file_cache_lock:
+        url = _file_cache.get(key)
+        if url is not None:
+            _file_cache.move_to_end(key)
+            return url
+
+    url = _b64_data_url(fh, mime)
+    with _file_cache_lock:
+        # Very large files would just evict everything else
+        if len(url) <= _file_cache_max_chars // 4 and key not in _file_cache:
+            _file_cache[key] = url
+            _file_cache_chars += len(url)
+            _evict_file_cache()
+    return url
 
 def process_image_input(image):
-    """Process image input (file path, bytes, base64, URL, or lists of those)"""
+    """Process image input (file path, bytes, PIL image, numpy array, base64, URL, or lists of those)"""
 
     if image is None:
         return None
 
     # Handle batched inputs
     if isinstance(image, list):
-        return [process_image_input(img) for img in image]
+        return _process_batch(process_image_input, image)
 
     # Single input handling
     if isinstance(image, str):
@@ -20,57 +189,102 @@ def process_image_input(image):
             return image
 
         # File path
-        if os.path.isfile(image):
-            try:
-                with open(image, "rb") as f:
-                    image_bytes = f.read()
-            except FileNotFoundError:
-                raise ValueError("File not found")
-            return "data:image/jpeg;base64," + base64.b64encode(image_bytes).decode("utf-8")
+        f = _open_if_file(image)
+        if f is not None:
+            with f:
+                return _file_data_url(f, "image/jpeg")
 
         # Assume base64
         return image
 
     if isinstance(image, bytes):
-        return "data:image/jpeg;base64," + base64.b64encode(image).decode("utf-8")
+        return "data:image/jpeg;base64," + base64.b64encode(image).decode("ascii")
 
-    if isinstance(image, Image.Image):
-        buf = io.BytesIO()
-        fmt = image.format or "PNG"
-        image.save(buf, format=fmt)
-        mime = "image/png" if fmt == "PNG" else "image/jpeg"
-        return f"data:{mime};base64," + base64.b64encode(buf.getvalue()).decode()
+    # PIL is only checked when the caller has already imported it
+    pil_image = sys.modules.get("PIL.Image")
+    if pil_image is not None and isinstance(image, pil_image.Image):
+        return _pil_data_url(image, pil_image)
+
+    # numpy is only checked when the caller has already imported it
+    if "numpy" in sys.modules and isinstance(image, sys.modules["numpy"].ndarray):
+        from PIL import Image
+
+        np = sys.modules["numpy"]
+        if np.issubdtype(image.dtype, np.floating):
+            # Normalized [0, 1] float pixels are sent as 8-bit, like any decoded image file
+            image = (np.clip(image, 0.0, 1.0) * 255.0 + 0.5).astype(np.uint8)
+
+        # fromarray reads the pixels through the array interface; no intermediate copy is made here
+        return _pil_data_url(Image.fromarray(image), Image)
 
     raise ValueError(
-        "Image must be a file path, bytes, PIL.Image, URL, base64 string, or a list of these"
+        "Image must be a file path, bytes, PIL.Image, numpy array, URL, base64 string, or a list of these"
     )
 
-def process_audio_input(file):
-    """Process audio file input"""
+def _pil_data_url(image, pil_image):
+    """Encode a PIL image in its original format (PNG for in-memory images) as a data URL"""
+    # Send an encoded image, never raw pixel data
+    buf = io.BytesIO()
+    fmt = image.format or "PNG"
+    save_kwargs = {}
+    if fmt == "JPEG":
+        # Optimized Huffman tables are cheap for JPEG; for PNG, `optimize` tries every
+        # filter and compression strategy and makes encoding several times slower.
+        save_kwargs["optimize"] = True
+        save_kwargs["quality"] = 90
+    image.save(buf, format=fmt, **save_kwargs)
+    mime = pil_image.MIME.get(fmt, "image/png")
+    return f"data:{mime};base64," + base64.b64encode(buf.getbuffer()).decode("ascii")
+
+def _pcm_wav_data_url(samples, sample_rate):
+    """Encode a numpy array of audio samples as a 16-bit PCM WAV data URL"""
+    np = sys.modules["numpy"]
+    if samples.dtype.kind == "f":
+        # Float audio is expected in [-1, 1]; 16-bit PCM is a quarter of float64's size
+        pcm = np.clip(samples, -1.0, 1.0) * 32767
+        pcm = pcm.astype("<i2", copy=False)
+    elif samples.dtype == np.int16:
+        pcm = samples.astype("<i2", copy=False)
+    else:
+        raise ValueError("Audio arrays must have a floating point or int16 dtype")
+    if pcm.ndim not in (1, 2):
+        raise ValueError("Audio arrays must be shaped (samples,) or (samples, channels)")
+    pcm = np.ascontiguousarray(pcm)
+
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wav:
+        wav.setnchannels(1 if pcm.ndim == 1 else pcm.shape[1])
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(memoryview(pcm).cast("B"))
+    return "data:audio/wav;base64," + base64.b64encode(buf.getbuffer()).decode("ascii")
+
+def process_audio_input(file, sample_rate=16000):
+    """Process audio file input (file path, bytes, file object, base64, or numpy samples at `sample_rate`)"""
     if file is None:
         return None
 
     # Handle batched inputs
     if isinstance(file, list):
-        return [process_audio_input(f) for f in file]
+        return _process_batch(partial(process_audio_input, sample_rate=sample_rate), file)
 
     if isinstance(file, str):
         # Check if it's a file path
-        if os.path.isfile(file):
-            try:
-                with open(file, "rb") as f:
-                    audio_bytes = f.read()
-            except FileNotFoundError:
-                raise ValueError("File not found")
-            return "data:audio/wav;base64," + base64.b64encode(audio_bytes).decode("utf-8")
+        f = _open_if_file(file)
+        if f is not None:
+            with f:
+                return _file_data_url(f, "audio/wav")
         # Assume it's already base64 or URL
         return file
     elif isinstance(file, bytes):
-        return "data:audio/wav;base64," + base64.b64encode(file).decode("utf-8")
+        return "data:audio/wav;base64," + base64.b64encode(file).decode("ascii")
     elif isinstance(file, io.IOBase):
-        return "data:audio/wav;base64," + base64.b64encode(file.read()).decode("utf-8")
+        return _b64_data_url(file, "audio/wav")
+    # numpy is only checked when the caller has already imported it
+    elif "numpy" in sys.modules and isinstance(file, sys.modules["numpy"].ndarray):
+        return _pcm_wav_data_url(file, sample_rate)
     else:
-        raise ValueError("File must be a file path, bytes, or base64 string")
+        raise ValueError("File must be a file path, bytes, numpy array, or base64 string")
 
 def process_video_input(file):
     """Process video file input"""
@@ -79,22 +293,37 @@ def process_video_input(file):
 
     # Handle batched inputs
     if isinstance(file, list):
-        return [process_video_input(f) for f in file]
+        return _process_batch(process_video_input, file)
 
     if isinstance(file, str):
         # Check if it's a file path
-        if os.path.isfile(file):
-            try:
-                with open(file, "rb") as f:
-                    video_bytes = f.read()
-            except FileNotFoundError:
-                raise ValueError("File not found")
-            return "data:video/mp4;base64," + base64.b64encode(video_bytes).decode("utf-8")
+        f = _open_if_file(file)
+        if f is not None:
+            with f:
+                return _file_data_url(f, "video/mp4")
         # Assume it's already base64 or URL
         return file
     elif isinstance(file, bytes):
-        return "data:video/mp4;base64," + base64.b64encode(file).decode("utf-8")
+        return "data:video/mp4;base64," + base64.b64encode(file).decode("ascii")
     elif isinstance(file, io.IOBase):
-        return "data:video/mp4;base64," + base64.b64encode(file.read()).decode("utf-8")
+        return _b64_data_url(file, "video/mp4")
     else:
         raise ValueError("File must be a file path, bytes, or base64 string")
+
+@contextmanager
+def open_upload(file, filename="audio.wav", content_type="application/octet-stream"):
+    """Yield an httpx `files=` entry streaming a path, bytes or binary file object as-is"""
+    if isinstance(file, (str, os.PathLike)):
+        try:
+            f = open(file, "rb")
+        except FileNotFoundError:
+            raise ValueError("File not found")
+        with f:
+            yield (os.path.basename(os.fspath(file)), f, content_type)
+    elif isinstance(file, (bytes, bytearray, memoryview)):
+        yield (filename, bytes(file), content_type)
+    elif isinstance(file, io.IOBase):
+        name = getattr(file, "name", None)
+        yield (os.path.basename(name) if isinstance(name, str) else filename, file, content_type)
+    else:
+        raise ValueError("File must be a file path, bytes, or a binary file object")
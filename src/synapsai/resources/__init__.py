@@ -16,18 +16,51 @@
 Resource handlers for SynapsAI client library
 """
 
-from .chat import ChatResource, AsyncChatResource
-from .images import ImagesResource, AsyncImagesResource
-from .videos import VideosResource, AsyncVideosResource
-from .embeddings import EmbeddingsResource, AsyncEmbeddingsResource
-from .audio import AudioResource, AsyncAudioResource, TranslationsResource, AsyncTranslationsResource
-from .completions import CompletionsResource, AsyncCompletionsResource
-from .classifications import ClassificationsResource, AsyncClassificationsResource
-from .question_answering import QuestionAnsweringResource, AsyncQuestionAnsweringResource
-from .models import ModelsResource, AsyncModelsResource
-from .feature_extraction import FeatureExtractionResource, AsyncFeatureExtractionResource
-from .fill_mask import FillMaskResource, AsyncFillMaskResource
-from .rerank import RerankResource, AsyncRerankResource
+import importlib
+
+# Resource classes are imported on first access (PEP 562) so that importing the
+# package does not pull in every resource module and its dependencies.
+_LAZY_IMPORTS = {
+    "ChatResource": ".chat",
+    "AsyncChatResource": ".chat",
+    "ImagesResource": ".images",
+    "AsyncImagesResource": ".images",
+    "VideosResource": ".videos",
+    "AsyncVideosResource": ".videos",
+    "EmbeddingsResource": ".embeddings",
+    "AsyncEmbeddingsResource": ".embeddings",
+    "AudioResource": ".audio",
+    "AsyncAudioResource": ".audio",
+    "TranslationsResource": ".audio",
+    "AsyncTranslationsResource": ".audio",
+    "CompletionsResource": ".completions",
+    "AsyncCompletionsResource": ".completions",
+    "ClassificationsResource": ".classifications",
+    "AsyncClassificationsResource": ".classifications",
+    "QuestionAnsweringResource": ".question_answering",
+    "AsyncQuestionAnsweringResource": ".question_answering",
+    "ModelsResource": ".models",
+    "AsyncModelsResource": ".models",
+    "FeatureExtractionResource": ".feature_extraction",
+    "AsyncFeatureExtractionResource": ".feature_extraction",
+    "FillMaskResource": ".fill_mask",
+    "AsyncFillMaskResource": ".fill_mask",
+    "RerankResource": ".rerank",
+    "AsyncRerankResource": ".rerank",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
 __all__ = [
     "ChatResource",
@@ -16,9 +16,13 @@
 Audio resource handlers
 """
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import Union, Iterator, AsyncIterator, List, TYPE_CHECKING, Literal, Optional
 from pathlib import Path
 
+import httpx
+
 from ..types.audio import (
     AudioSpeechResponse,
     AudioTranscriptionResponse,
@@ -28,12 +32,18 @@ from ..types.audio import (
     AudioFormat,
     TimestampGranularity,
 )
-from ..processing import process_audio_input
+from ..processing import process_audio_input, open_upload
 from ..logging import get_logger
-from ..exceptions import APIError
+from ..utils import StreamChunkParser
 
 logger = get_logger(__name__)
 
+# Default number of in-flight requests for batched transcription.
+_BATCH_MAX_CONCURRENCY = 8
+
+# Read size used when streaming synthesized audio back to the caller.
+_AUDIO_STREAM_CHUNK = 64 * 1024
+
 if TYPE_CHECKING:
     from ..client import SynapsAI, AsyncSynapsAI
 
@@ -41,8 +51,9 @@ if TYPE_CHECKING:
 class _SpeechStreamingResponse:
     """Synchronous streaming response wrapper for speech audio."""
 
-    def __init__(self, response):
+    def __init__(self, response, chunk_size: int = _AUDIO_STREAM_CHUNK):
         self._response = response
+        self._chunk_size = chunk_size
 
     def __enter__(self) -> "_SpeechStreamingResponse":
         return self
@@ -53,22 +64,31 @@ class _SpeechStreamingResponse:
             close()
 
     def __iter__(self) -> Iterator[bytes]:
-        for chunk in self._response.iter_bytes(chunk_size=8192):
-            if chunk:
-                yield chunk
+        # httpx never yields empty chunks
+        yield from self._response.iter_bytes(chunk_size=self._chunk_size)
 
     def stream_to_file(self, file_path) -> None:
         """Stream audio to a file path or file-like object."""
         # Accept both Path-like and str for convenience
         if hasattr(file_path, "write"):
             # File-like object
-            for chunk in self:
-                file_path.write(chunk)
+            self._write_to(file_path)
         else:
             path = Path(file_path)
             with path.open("wb") as f:
-                for chunk in self:
-                    f.write(chunk)
+                self._write_to(f)
+
+    def _write_to(self, f) -> None:
+        try:
+            content = self._response.content
+        except httpx.ResponseNotRead:
+            content = None
+        if content is not None:
+            # Body is already buffered: write it in one call instead of re-chunking it
+            f.write(content)
+        else:
+            for chunk in self:
+                f.write(chunk)
 
 
 class _SpeechWithStreamingResponse:
@@ -140,12 +160,13 @@ class TranscriptionsResource:
         repetition_penalty: Optional[float] = None,
         timestamp_granularities: List[Union[str, TimestampGranularity]] = None,
         stream: bool = False,
+        multipart: bool = False,
         **kwargs
     ) -> Union[AudioTranscriptionResponse, Iterator[AudioTranscriptionChunk]]:
-        """Transcribe audio to text"""
+        """Transcribe audio to text. With `multipart=True` the file is uploaded as raw form data instead of base64 JSON."""
         
-        # Handle file input
-        file_data = process_audio_input(file)
+        # Handle file input (multipart uploads send the file as-is)
+        file_data = None if multipart else process_audio_input(file)
         
         # Build request
         request_data = self._client._build_request(
@@ -172,27 +193,44 @@ class TranscriptionsResource:
         endpoint = "audio/transcriptions"
 
         if stream:
-            return self._stream_transcriptions(endpoint, request_data)
+            return self._stream_transcriptions(endpoint, request_data, file if multipart else None)
+        elif multipart:
+            with open_upload(file) as upload:
+                response = self._client._post(endpoint, data=request_data, files={"file": upload})
+            return AudioTranscriptionResponse.model_validate_json(response.content)
         else:
             response = self._client._post(endpoint, json_data=request_data)
-            return AudioTranscriptionResponse(**response.json())
-
-    def _stream_transcriptions(self, endpoint, request_data) -> Iterator[AudioTranscriptionChunk]:
-        for chunk_data in self._client._stream_response(endpoint, request_data):
-            try:
-                error = chunk_data.get("error")
-                if error:
-                    raise APIError(error)
-                yield AudioTranscriptionChunk(**chunk_data)
-            except APIError as e:
-                raise e
-            except Exception as e:
-                logger.warning(
-                    "Failed to parse AudioTranscriptionChunk",
-                    exc_info=True,
-                    extra={"endpoint": endpoint},
-                )
-                continue
+            return AudioTranscriptionResponse.model_validate_json(response.content)
+
+    def create_batch(
+        self,
+        model: str,
+        files: List,
+        max_concurrency: int = _BATCH_MAX_CONCURRENCY,
+        **kwargs
+    ) -> List[AudioTranscriptionResponse]:
+        """Transcribe several audio files concurrently, encoding and sending up to `max_concurrency` at a time. Results keep input order."""
+        if not files:
+            return []
+        # Each worker encodes its file and waits on its own request, so encoding overlaps network I/O
+        with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(files)))) as pool:
+            return list(pool.map(lambda file: self.create(model=model, file=file, **kwargs), files))
+
+    def _stream_multipart(self, endpoint, request_data, file) -> Iterator[bytearray]:
+        # Keep the upload open until the stream is consumed
+        with open_upload(file) as upload:
+            yield from self._client._stream_response(endpoint, data=request_data, files={"file": upload}, raw=True)
+
+    def _stream_transcriptions(self, endpoint, request_data, upload_file=None) -> Iterator[AudioTranscriptionChunk]:
+        if upload_file is None:
+            chunks = self._client._stream_response(endpoint, request_data, raw=True)
+        else:
+            chunks = self._stream_multipart(endpoint, request_data, upload_file)
+        with StreamChunkParser(AudioTranscriptionChunk, endpoint, logger) as parse:
+            for payload in chunks:
+                chunk = parse(payload)
+                if chunk is not None:
+                    yield chunk
 
 
 class TranslationsResource:
@@ -253,24 +291,14 @@ class TranslationsResource:
             return self._stream_translations(endpoint, request_data)
         else:
             response = self._client._post(endpoint, json_data=request_data)
-            return AudioTranslationResponse(**response.json())
+            return AudioTranslationResponse.model_validate_json(response.content)
 
     def _stream_translations(self, endpoint, request_data) -> Iterator[AudioTranslationChunk]:
-        for chunk_data in self._client._stream_response(endpoint, request_data):
-            try:
-                error = chunk_data.get("error")
-                if error:
-                    raise APIError(error)
-                yield AudioTranslationChunk(**chunk_data)
-            except APIError as e:
-                raise e
-            except Exception:
-                logger.warning(
-                    "Failed to parse AudioTranslationChunk",
-                    exc_info=True,
-                    extra={"endpoint": endpoint},
-                )
-                continue
+        with StreamChunkParser(AudioTranslationChunk, endpoint, logger) as parse:
+            for payload in self._client._stream_response(endpoint, request_data, raw=True):
+                chunk = parse(payload)
+                if chunk is not None:
+                    yield chunk
 
 
 class AudioResource:
@@ -330,9 +358,8 @@ class AsyncSpeechResource:
     
     async def _stream_audio(self, response) -> AsyncIterator[bytes]:
         """Stream audio chunks asynchronously"""
-        async for chunk in response.aiter_bytes(chunk_size=8192):
-            if chunk:
-                yield chunk
+        async for chunk in response.aiter_bytes(chunk_size=_AUDIO_STREAM_CHUNK):
+            yield chunk
 
 
 class AsyncTranscriptionsResource:
@@ -360,12 +387,13 @@ class AsyncTranscriptionsResource:
         repetition_penalty: Optional[float] = None,
         timestamp_granularities: List[Union[str, TimestampGranularity]] = None,
         stream: bool = False,
+        multipart: bool = False,
         **kwargs
     ) -> Union[AudioTranscriptionResponse, AsyncIterator[AudioTranscriptionChunk]]:
-        """Transcribe audio to text asynchronously"""
+        """Transcribe audio to text asynchronously. With `multipart=True` the file is uploaded as raw form data instead of base64 JSON."""
         
-        # Handle file input
-        file_data = process_audio_input(file)
+        # Handle file input (multipart uploads send the file as-is)
+        file_data = None if multipart else await asyncio.to_thread(process_audio_input, file)
         
         # Build request
         request_data = self._client._build_request(
@@ -392,23 +420,48 @@ class AsyncTranscriptionsResource:
         endpoint = "audio/transcriptions"
 
         if stream:
-            return self._stream_transcriptions(endpoint, request_data)
+            return self._stream_transcriptions(endpoint, request_data, file if multipart else None)
+        elif multipart:
+            with open_upload(file) as upload:
+                response = await self._client._post(endpoint, data=request_data, files={"file": upload})
+            return AudioTranscriptionResponse.model_validate_json(response.content)
         else:
             response = await self._client._post(endpoint, json_data=request_data)
-            return AudioTranscriptionResponse(**response.json())
+            return AudioTranscriptionResponse.model_validate_json(response.content)
+
+    async def create_batch(
+        self,
+        model: str,
+        files: List,
+        max_concurrency: int = _BATCH_MAX_CONCURRENCY,
+        **kwargs
+    ) -> List[AudioTranscriptionResponse]:
+        """Transcribe several audio files concurrently with up to `max_concurrency` requests in flight. Results keep input order."""
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def transcribe(file):
+            async with semaphore:
+                return await self.create(model=model, file=file, **kwargs)
+
+        return list(await asyncio.gather(*(transcribe(file) for file in files)))
 
-    async def _stream_transcriptions(self, endpoint, request_data) -> AsyncIterator[AudioTranscriptionChunk]:
+    async def _stream_multipart(self, endpoint, request_data, file) -> AsyncIterator[bytearray]:
+        # Keep the upload open until the stream is consumed
+        with open_upload(file) as upload:
+            async for payload in self._client._stream_response(endpoint, data=request_data, files={"file": upload}, raw=True):
+                yield payload
+
+    async def _stream_transcriptions(self, endpoint, request_data, upload_file=None) -> AsyncIterator[AudioTranscriptionChunk]:
         """Stream transcription chunks asynchronously"""
-        async for chunk_data in self._client._stream_response(endpoint, request_data):
-            try:
-                yield AudioTranscriptionChunk(**chunk_data)
-            except Exception:
-                logger.warning(
-                    "Failed to parse AudioTranscriptionChunk",
-                    exc_info=True,
-                    extra={"endpoint": endpoint},
-                )
-                continue
+        if upload_file is None:
+            chunks = self._client._stream_response(endpoint, request_data, raw=True)
+        else:
+            chunks = self._stream_multipart(endpoint, request_data, upload_file)
+        with StreamChunkParser(AudioTranscriptionChunk, endpoint, logger) as parse:
+            async for payload in chunks:
+                chunk = parse(payload)
+                if chunk is not None:
+                    yield chunk
 
 
 class AsyncTranslationsResource:
@@ -440,7 +493,7 @@ class AsyncTranslationsResource:
         """Translate audio to English text asynchronously"""
         
         # Handle file input
-        file_data = process_audio_input(file)
+        file_data = await asyncio.to_thread(process_audio_input, file)
         
         # Build request
         request_data = self._client._build_request(
@@ -469,20 +522,15 @@ class AsyncTranslationsResource:
             return self._stream_translations(endpoint, request_data)
         else:
             response = await self._client._post(endpoint, json_data=request_data)
-            return AudioTranslationResponse(**response.json())
+            return AudioTranslationResponse.model_validate_json(response.content)
 
     async def _stream_translations(self, endpoint, request_data) -> AsyncIterator[AudioTranslationChunk]:
         """Stream translation chunks asynchronously"""
-        async for chunk_data in self._client._stream_response(endpoint, request_data):
-            try:
-                yield AudioTranslationChunk(**chunk_data)
-            except Exception:
-                logger.warning(
-                    "Failed to parse AudioTranslationChunk",
-                    exc_info=True,
-                    extra={"endpoint": endpoint},
-                )
-                continue
+        with StreamChunkParser(AudioTranslationChunk, endpoint, logger) as parse:
+            async for payload in self._client._stream_response(endpoint, request_data, raw=True):
+                chunk = parse(payload)
+                if chunk is not None:
+                    yield chunk
 
 
 class AsyncAudioResource:
@@ -492,4 +540,14 @@ class AsyncAudioResource:
         self._client = client
         self.speech = AsyncSpeechResource(client)
         self.transcriptions = AsyncTranscriptionsResource(client)
-        self.translations = AsyncTranslationsResource(client)
\ No newline at end of file
+        self.translations = AsyncTranslationsResource(client)
+
+    async def transcribe_many(
+        self,
+        model: str,
+        files: List,
+        max_concurrency: int = _BATCH_MAX_CONCURRENCY,
+        **kwargs
+    ) -> List[AudioTranscriptionResponse]:
+        """Transcribe several audio files concurrently over the client's pooled connections. Results keep input order."""
+        return await self.transcriptions.create_batch(model, files, max_concurrency=max_concurrency, **kwargs)
@@ -16,20 +16,43 @@
 Chat completion resource handlers
 """
 
-from typing import Union, Iterator, AsyncIterator, TYPE_CHECKING, Optional, Literal
+from typing import Union, Iterator, AsyncIterator, TYPE_CHECKING, Optional, Literal, List
 
 from ..types.completion import (
     ChatCompletionResponse,
     ChatCompletionChunk,
 )
 from ..logging import get_logger
-from ..exceptions import APIError
+from ..utils import avalidate_json, json_dumps, StreamChunkParser
 
 if TYPE_CHECKING:
     from ..client import SynapsAI, AsyncSynapsAI
 
 logger = get_logger(__name__)
 
+
+class PreparedChatRequest:
+    """
+    Chat completion parameters serialized once for reuse across calls.
+
+    Obtain one from `chat.completions.precompile(...)` and pass it to `create_prepared` together with
+    the messages for each call; only the messages are serialized per request.
+    """
+
+    __slots__ = ("stream", "_prefix")
+
+    def __init__(self, request_data: dict):
+        if "messages" in request_data:
+            raise ValueError("`messages` are passed per call to `create_prepared`, not to `precompile`")
+        self.stream = bool(request_data.get("stream"))
+        # Drop the closing brace so each call only appends its messages
+        self._prefix = json_dumps(request_data)[:-1] + b',"messages":'
+
+    def render(self, messages: list) -> bytes:
+        """Return the full JSON request body for `messages`"""
+        return self._prefix + json_dumps(messages) + b"}"
+
+
 class ChatCompletionsResource:
     """Chat completions resource"""
     
@@ -44,7 +67,7 @@ class ChatCompletionsResource:
         top_p: float = 1.0,
         n: int = 1,
         stream: bool = False,
-        stop = [],
+        stop = None,
         max_completion_tokens = 128,
         presence_penalty: float = 0.0,
         frequency_penalty: float = 0.0,
@@ -56,9 +79,10 @@ class ChatCompletionsResource:
         response_format = None,
         seed = None,
         reasoning_effort: Optional[Literal["none", "minimal", "low", "medium", "high", "xhigh", "max"]] = None,
+        batched_stream: bool = False,
         **kwargs
-    ) -> Union[ChatCompletionResponse, Iterator[ChatCompletionChunk]]:
-        """Create a chat completion"""
+    ) -> Union[ChatCompletionResponse, Iterator[ChatCompletionChunk], Iterator[List[ChatCompletionChunk]]]:
+        """Create a chat completion. With `stream=True, batched_stream=True` chunks arriving together are yielded as lists."""
         
         # Build request
         request_data = self._client._build_request(
@@ -86,27 +110,87 @@ class ChatCompletionsResource:
         endpoint = "chat/completions"
         
         if stream:
+            if batched_stream:
+                return self._stream_completion_batches(endpoint, request_data)
             return self._stream_completions(endpoint, request_data)
         else:
             response = self._client._post(endpoint, request_data)
-            return ChatCompletionResponse.model_validate(response.json())
+            return ChatCompletionResponse.model_validate_json(response.content)
+
+    def precompile(
+        self,
+        model: str,
+        temperature: float = 1.0,
+        top_p: float = 1.0,
+        n: int = 1,
+        stream: bool = False,
+        stop = None,
+        max_completion_tokens = 128,
+        presence_penalty: float = 0.0,
+        frequency_penalty: float = 0.0,
+        logit_bias = None,
+        functions = None,
+        function_call = None,
+        tools = None,
+        tool_choice = None,
+        response_format = None,
+        seed = None,
+        reasoning_effort: Optional[Literal["none", "minimal", "low", "medium", "high", "xhigh", "max"]] = None,
+        **kwargs
+    ) -> PreparedChatRequest:
+        """Serialize the fixed parameters of repeated chat completion calls once (everything but `messages`)"""
+        return PreparedChatRequest(self._client._build_request(
+            model=model,
+            temperature=temperature,
+            top_p=top_p,
+            n=n,
+            stream=stream,
+            stop=stop,
+            max_completion_tokens=max_completion_tokens,
+            presence_penalty=presence_penalty,
+            frequency_penalty=frequency_penalty,
+            logit_bias=logit_bias,
+            functions=functions,
+            function_call=function_call,
+            tools=tools,
+            tool_choice=tool_choice,
+            response_format=response_format,
+            seed=seed,
+            reasoning_effort=reasoning_effort,
+            **kwargs
+        ))
+
+    def create_prepared(
+        self,
+        prepared: PreparedChatRequest,
+        messages: list,
+        batched_stream: bool = False,
+    ) -> Union[ChatCompletionResponse, Iterator[ChatCompletionChunk], Iterator[List[ChatCompletionChunk]]]:
+        """Create a chat completion from a `precompile`d request, serializing only `messages`"""
+        body = prepared.render(messages)
+        endpoint = "chat/completions"
+
+        if prepared.stream:
+            if batched_stream:
+                return self._stream_completion_batches(endpoint, body)
+            return self._stream_completions(endpoint, body)
+        else:
+            response = self._client._post(endpoint, body)
+            return ChatCompletionResponse.model_validate_json(response.content)
 
     def _stream_completions(self, endpoint, request_data) -> Iterator[ChatCompletionChunk]:
-        for chunk_data in self._client._stream_response(endpoint, request_data):
-            try:
-                error = chunk_data.get("error")
-                if error:
-                    raise APIError(error)
-                yield ChatCompletionChunk.model_validate(chunk_data)
-            except APIError as e:
-                raise e
-            except Exception as e:
-                logger.warning(
-                    "Failed to parse ChatCompletionChunk",
-                    exc_info=True,
-                    extra={"endpoint": endpoint},
-                )
-                continue
+        with StreamChunkParser(ChatCompletionChunk, endpoint, logger) as parse:
+            for payload in self._client._stream_response(endpoint, request_data, raw=True):
+                chunk = parse(payload)
+                if chunk is not None:
+                    yield chunk
+
+    def _stream_completion_batches(self, endpoint, request_data) -> Iterator[List[ChatCompletionChunk]]:
+        with StreamChunkParser(ChatCompletionChunk, endpoint, logger) as parse:
+            for payloads in self._client._stream_response(endpoint, request_data, raw=True, batched=True):
+                chunks = [chunk for chunk in map(parse, payloads) if chunk is not None]
+                if chunks:
+                    yield chunks
 
 class ChatResource:
     """Chat resource handler"""
@@ -130,7 +214,7 @@ class AsyncChatCompletionsResource:
         top_p: float = 1.0,
         n: int = 1,
         stream: bool = False,
-        stop = [],
+        stop = None,
         max_completion_tokens = 128,
         presence_penalty: float = 0.0,
         frequency_penalty: float = 0.0,
@@ -142,9 +226,10 @@ class AsyncChatCompletionsResource:
         response_format = None,
         seed = None,
         reasoning_effort: Optional[Literal["none", "minimal", "low", "medium", "high", "xhigh", "max"]] = None,
+        batched_stream: bool = False,
         **kwargs
-    ) -> Union[ChatCompletionResponse, AsyncIterator[ChatCompletionChunk]]:
-        """Create a chat completion asynchronously"""
+    ) -> Union[ChatCompletionResponse, AsyncIterator[ChatCompletionChunk], AsyncIterator[List[ChatCompletionChunk]]]:
+        """Create a chat completion asynchronously. With `stream=True, batched_stream=True` chunks arriving together are yielded as lists."""
         
         # Build request
         request_data = self._client._build_request(
@@ -172,23 +257,49 @@ class AsyncChatCompletionsResource:
         endpoint = "chat/completions"
 
         if stream:
+            if batched_stream:
+                return self._stream_completion_batches(endpoint, request_data)
             return self._stream_completions(endpoint, request_data)
         else:
             response = await self._client._post(endpoint, request_data)
-            return ChatCompletionResponse.model_validate(response.json())
+            return await avalidate_json(ChatCompletionResponse, response.content)
     
+    # Precompiling does no I/O, so it is shared with the sync resource
+    precompile = ChatCompletionsResource.precompile
+
+    async def create_prepared(
+        self,
+        prepared: PreparedChatRequest,
+        messages: list,
+        batched_stream: bool = False,
+    ) -> Union[ChatCompletionResponse, AsyncIterator[ChatCompletionChunk], AsyncIterator[List[ChatCompletionChunk]]]:
+        """Create a chat completion asynchronously from a `precompile`d request, serializing only `messages`"""
+        body = prepared.render(messages)
+        endpoint = "chat/completions"
+
+        if prepared.stream:
+            if batched_stream:
+                return self._stream_completion_batches(endpoint, body)
+            return self._stream_completions(endpoint, body)
+        else:
+            response = await self._client._post(endpoint, body)
+            return await avalidate_json(ChatCompletionResponse, response.content)
+
     async def _stream_completions(self, endpoint, request_data) -> AsyncIterator[ChatCompletionChunk]:
         """Stream chat completion chunks asynchronously"""
-        async for chunk_data in self._client._stream_response(endpoint, request_data):
-            try:
-                yield ChatCompletionChunk.model_validate(chunk_data)
-            except Exception as e:
-                logger.warning(
-                    "Failed to parse ChatCompletionChunk",
-                    exc_info=True,
-                    extra={"endpoint": endpoint},
-                )
-                continue
+        with StreamChunkParser(ChatCompletionChunk, endpoint, logger) as parse:
+            async for payload in self._client._stream_response(endpoint, request_data, raw=True):
+                chunk = parse(payload)
+                if chunk is not None:
+                    yield chunk
+
+    async def _stream_completion_batches(self, endpoint, request_data) -> AsyncIterator[List[ChatCompletionChunk]]:
+        """Stream chat completion chunks asynchronously, grouped by network read"""
+        with StreamChunkParser(ChatCompletionChunk, endpoint, logger) as parse:
+            async for payloads in self._client._stream_response(endpoint, request_data, raw=True, batched=True):
+                chunks = [chunk for chunk in map(parse, payloads) if chunk is not None]
+                if chunks:
+                    yield chunks
 
 
 class AsyncChatResource:
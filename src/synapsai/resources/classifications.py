@@ -16,6 +16,8 @@
 Classification resource handlers
 """
 
+import asyncio
+from functools import lru_cache
 from typing import TYPE_CHECKING, Optional, Union, List
 from ..types.classifications import (
     AudioClassificationResponse,
@@ -23,24 +25,54 @@ from ..types.classifications import (
     TextClassificationResponse,
     TokenClassificationResponse,
     VideoClassificationResponse,
-    VideoClassificationResponse,
     ZeroShotAudioClassificationResponse,
     ZeroShotClassificationResponse,
     ZeroShotImageClassificationResponse,
     ZeroShotObjectDetectionResponse,
 )
-from PIL import Image
-import numpy as np
 from ..processing import process_image_input, process_audio_input, process_video_input
+from ..utils import json_dumps, json_loads
+
+# Upper bound on concurrent requests when list inputs are fanned out.
+_FAN_OUT_CONCURRENCY = 8
+
+
+@lru_cache(maxsize=1024)
+def _zero_shot_text_prefix(model, candidate_labels, hypothesis_template, multi_label) -> bytes:
+    """Serialized zero-shot text request minus its `sequences`, left open (no closing brace)"""
+    fixed = {
+        "model": model,
+        "candidate_labels": candidate_labels,
+        "hypothesis_template": hypothesis_template,
+        "multi_label": multi_label,
+    }
+    return json_dumps({k: v for k, v in fixed.items() if v is not None})[:-1]
+
+
+def _zero_shot_text_body(model, sequences, candidate_labels, hypothesis_template, multi_label) -> bytes:
+    """
+    Build a zero-shot text request body, reusing the serialized labels of earlier calls.
+    None fields are omitted, as `_build_request` does.
+    """
+    if candidate_labels is not None and not isinstance(candidate_labels, str):
+        candidate_labels = tuple(candidate_labels)
+    prefix = _zero_shot_text_prefix(model, candidate_labels, hypothesis_template, multi_label)
+    if sequences is None:
+        return prefix + b"}"
+    separator = b"," if len(prefix) > 1 else b""
+    return prefix + separator + b'"sequences":' + json_dumps(sequences) + b"}"
 
 
 if TYPE_CHECKING:
+    import numpy as np
+    from PIL import Image
     from ..client import SynapsAI, AsyncSynapsAI
 
 
-
 class ZeroShotClassificationsResource:
     """Zero-Shot Classification resource handler"""
+
+    __slots__ = ("_client",)
     
     def __init__(self, client: "SynapsAI"):
         self._client = client
@@ -65,7 +97,7 @@ class ZeroShotClassificationsResource:
 
         endpoint = "classifications/zero-shot/audio"
         response = self._client._post(endpoint, json_data=request_data)
-        return ZeroShotAudioClassificationResponse.model_validate(response.json())
+        return ZeroShotAudioClassificationResponse.model_validate_json(response.content)
 
     def text(
         self,
@@ -77,22 +109,17 @@ class ZeroShotClassificationsResource:
     ) -> ZeroShotClassificationResponse:
         """Zero-shot text classification."""
 
-        request_data = self._client._build_request(
-            model=model,
-            sequences=sequences,
-            candidate_labels=candidate_labels,
-            hypothesis_template=hypothesis_template,
-            multi_label=multi_label,
-        )
+        # Labels and template are usually identical across calls; only the sequences are serialized each time
+        request_data = _zero_shot_text_body(model, sequences, candidate_labels, hypothesis_template, multi_label)
 
         endpoint = "classifications/zero-shot"
         response = self._client._post(endpoint, json_data=request_data)
-        return ZeroShotClassificationResponse.model_validate(response.json())
+        return ZeroShotClassificationResponse.model_validate_json(response.content)
 
     def image(
         self,
         model: str,
-        image: Union[str, List[str], Image.Image, List[Image.Image]],
+        image: Union[str, List[str], "Image.Image", List["Image.Image"], "np.ndarray"],
         candidate_labels: list[str],
         hypothesis_template: Optional[str] = None,
         timeout: Optional[float] = None,
@@ -111,10 +138,12 @@ class ZeroShotClassificationsResource:
 
         endpoint = "classifications/zero-shot/image"
         response = self._client._post(endpoint, json_data=request_data)
-        return ZeroShotImageClassificationResponse.model_validate(response.json())
+        return ZeroShotImageClassificationResponse.model_validate_json(response.content)
 
 class ClassificationsResource:
     """Classification resource handler"""
+
+    __slots__ = ("_client", "zero_shot")
     
     def __init__(self, client: "SynapsAI"):
         self._client = client
@@ -123,7 +152,7 @@ class ClassificationsResource:
     def audio(
         self,
         model: str,
-        inputs: Union[np.ndarray, bytes, dict], 
+        inputs: Union["np.ndarray", bytes, dict], 
         top_k: Optional[int] = None, 
         function_to_apply: Optional[str] = None,
     ) -> AudioClassificationResponse:
@@ -143,13 +172,12 @@ class ClassificationsResource:
         
         # Make request
         response = self._client._post(endpoint, json_data=request_data)
-        response_data = response.json()
-        return AudioClassificationResponse(**response_data)
+        return AudioClassificationResponse.model_validate_json(response.content)
     
     def image(
         self,
         model: str,
-        inputs: Union[str, list[str], Image.Image, list[Image.Image]], 
+        inputs: Union[str, List[str], "Image.Image", List["Image.Image"], "np.ndarray"], 
         function_to_apply: Optional[str] = None, 
         top_k: Optional[int] = None, 
         timeout: Optional[float] = None,
@@ -171,8 +199,7 @@ class ClassificationsResource:
         
         # Make request
         response = self._client._post(endpoint, json_data=request_data)
-        response_data = response.json()
-        return ImageClassificationResponse.model_validate(response_data)
+        return ImageClassificationResponse.model_validate_json(response.content)
     
     def text(
         self,
@@ -195,8 +222,7 @@ class ClassificationsResource:
         
         # Make request
         response = self._client._post(endpoint, json_data=request_data)
-        response_data = response.json()
-        return TextClassificationResponse.model_validate(response_data)
+        return TextClassificationResponse.model_validate_json(response.content)
     
     def token(
         self,
@@ -215,8 +241,7 @@ class ClassificationsResource:
         
         # Make request
         response = self._client._post(endpoint, json_data=request_data)
-        response_data = response.json()
-        return TokenClassificationResponse.model_validate(response_data)
+        return TokenClassificationResponse.model_validate_json(response.content)
     
     def video(
         self,
@@ -245,13 +270,14 @@ class ClassificationsResource:
 
         # Make request
         response = self._client._post(endpoint, json_data=request_data)
-        response_data = response.json()
-        return VideoClassificationResponse.model_validate(response_data)
+        return VideoClassificationResponse.model_validate_json(response.content)
   
 
 
 class AsyncZeroShotClassificationsResource:
     """Async Zero-Shot Classification resource handler"""
+
+    __slots__ = ("_client",)
     
     def __init__(self, client: "AsyncSynapsAI"):
         self._client = client
@@ -265,6 +291,8 @@ class AsyncZeroShotClassificationsResource:
     ) -> ZeroShotAudioClassificationResponse:
         """Assign labels to the audio(s) passed as inputs (zero-shot)."""
 
+        audios = await asyncio.to_thread(process_audio_input, audios)
+
         request_data = self._client._build_request(
             model=model,
             audios=audios,
@@ -274,7 +302,7 @@ class AsyncZeroShotClassificationsResource:
 
         endpoint = "classifications/zero-shot/audio"
         response = await self._client._post(endpoint, json_data=request_data)
-        return ZeroShotAudioClassificationResponse.model_validate(response.json())
+        return ZeroShotAudioClassificationResponse.model_validate_json(response.content)
 
     async def text(
         self,
@@ -286,28 +314,25 @@ class AsyncZeroShotClassificationsResource:
     ) -> ZeroShotClassificationResponse:
         """Zero-shot text classification."""
 
-        request_data = self._client._build_request(
-            model=model,
-            sequences=sequences,
-            candidate_labels=candidate_labels,
-            hypothesis_template=hypothesis_template,
-            multi_label=multi_label,
-        )
+        # Labels and template are usually identical across calls; only the sequences are serialized each time
+        request_data = _zero_shot_text_body(model, sequences, candidate_labels, hypothesis_template, multi_label)
 
         endpoint = "classifications/zero-shot"
         response = await self._client._post(endpoint, json_data=request_data)
-        return ZeroShotClassificationResponse.model_validate(response.json())
+        return ZeroShotClassificationResponse.model_validate_json(response.content)
 
     async def image(
         self,
         model: str,
-        image: Union[str, List[str], Image.Image, List[Image.Image]],
+        image: Union[str, List[str], "Image.Image", List["Image.Image"], "np.ndarray"],
         candidate_labels: list[str],
         hypothesis_template: Optional[str] = None,
         timeout: Optional[float] = None,
     ) -> ZeroShotImageClassificationResponse:
         """Zero-shot image classification."""
 
+        image = await asyncio.to_thread(process_image_input, image)
+
         request_data = self._client._build_request(
             model=model,
             image=image,
@@ -318,26 +343,59 @@ class AsyncZeroShotClassificationsResource:
 
         endpoint = "classifications/zero-shot/image"
         response = await self._client._post(endpoint, json_data=request_data)
-        return ZeroShotImageClassificationResponse.model_validate(response.json())
+        return ZeroShotImageClassificationResponse.model_validate_json(response.content)
 
 
 class AsyncClassificationsResource:
     """Async Classification resource handler"""
+
+    __slots__ = ("_client", "zero_shot")
     
     def __init__(self, client: "AsyncSynapsAI"):
         self._client = client
         self.zero_shot = AsyncZeroShotClassificationsResource(client)
 
+    async def _post_inputs(self, endpoint: str, request_data: dict, response_cls):
+        """
+        POST `request_data` and validate the result as `response_cls`, fanning a list of `inputs`
+        out into one concurrent request per item when the client has `parallel_list_inputs` enabled.
+
+        Fanned-out results are concatenated in input order.
+        """
+        inputs = request_data["inputs"]
+        if not (self._client.parallel_list_inputs and isinstance(inputs, list) and len(inputs) > 1):
+            response = await self._client._post(endpoint, json_data=request_data)
+            return response_cls.model_validate_json(response.content)
+
+        semaphore = asyncio.Semaphore(_FAN_OUT_CONCURRENCY)
+
+        async def post_one(item):
+            async with semaphore:
+                response = await self._client._post(endpoint, json_data={**request_data, "inputs": item})
+                return json_loads(response.content)
+
+        results = await asyncio.gather(*(post_one(item) for item in inputs))
+        merged = dict(results[0])
+        merged["data"] = [entry for result in results for entry in result["data"]]
+        usages = [result.get("usage") for result in results]
+        if all(usages):
+            merged["usage"] = {
+                "prompt_tokens": sum(u["prompt_tokens"] for u in usages),
+                "total_tokens": sum(u["total_tokens"] for u in usages),
+            }
+        return response_cls.model_validate(merged)
 
     async def audio(
         self,
         model: str,
-        inputs: Union[np.ndarray, bytes, dict], 
+        inputs: Union["np.ndarray", bytes, dict], 
         top_k: Optional[int] = None, 
         function_to_apply: Optional[str] = None,
     ) -> AudioClassificationResponse:
         """Audio classification."""
         
+        inputs = await asyncio.to_thread(process_audio_input, inputs)
+        
         # Build request
         request_data = self._client._build_request(
             model=model,
@@ -350,19 +408,20 @@ class AsyncClassificationsResource:
         
         # Make request
         response = await self._client._post(endpoint, json_data=request_data)
-        response_data = response.json()
-        return AudioClassificationResponse.model_validate(response_data)
+        return AudioClassificationResponse.model_validate_json(response.content)
     
     async def image(
         self,
         model: str,
-        inputs: Union[str, list[str], Image.Image, list[Image.Image]], 
+        inputs: Union[str, List[str], "Image.Image", List["Image.Image"], "np.ndarray"], 
         function_to_apply: Optional[str] = None, 
         top_k: Optional[int] = None, 
         timeout: Optional[float] = None,
     ) -> ImageClassificationResponse:
         """Assign labels to the image(s) passed as inputs."""
         
+        inputs = await asyncio.to_thread(process_image_input, inputs)
+        
         # Build request
         request_data = self._client._build_request(
             model=model,
@@ -375,9 +434,7 @@ class AsyncClassificationsResource:
         endpoint = "classifications/image"
 
         # Make request
-        response = await self._client._post(endpoint, json_data=request_data)
-        response_data = response.json()
-        return ImageClassificationResponse.model_validate(response_data)
+        return await self._post_inputs(endpoint, request_data, ImageClassificationResponse)
     
     async def text(
         self,
@@ -399,9 +456,7 @@ class AsyncClassificationsResource:
         endpoint = "classifications/text"
 
         # Make request
-        response = await self._client._post(endpoint, json_data=request_data)
-        response_data = response.json()
-        return TextClassificationResponse.model_validate(response_data)
+        return await self._post_inputs(endpoint, request_data, TextClassificationResponse)
     
     async def token(
         self,
@@ -420,8 +475,7 @@ class AsyncClassificationsResource:
         
         # Make request
         response = await self._client._post(endpoint, json_data=request_data)
-        response_data = response.json()
-        return TokenClassificationResponse.model_validate(response_data)
+        return TokenClassificationResponse.model_validate_json(response.content)
     
     async def video(
         self,
@@ -434,7 +488,7 @@ class AsyncClassificationsResource:
     ) -> VideoClassificationResponse:
         """Assign labels to the video(s) passed as inputs."""
         
-        inputs = process_video_input(inputs)
+        inputs = await asyncio.to_thread(process_video_input, inputs)
         
         # Build request
         request_data = self._client._build_request(
@@ -449,6 +503,4 @@ class AsyncClassificationsResource:
         endpoint = "classifications/video"
 
         # Make request
-        response = await self._client._post(endpoint, json_data=request_data)
-        response_data = response.json()
-        return VideoClassificationResponse.model_validate(response_data)
+        return await self._post_inputs(endpoint, request_data, VideoClassificationResponse)
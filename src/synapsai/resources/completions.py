@@ -16,7 +16,7 @@
 Chat completion resource handlers
 """
 
-from typing import Union, Iterator, AsyncIterator, TYPE_CHECKING, Optional, Dict
+from typing import Union, Iterator, AsyncIterator, TYPE_CHECKING, Optional, Dict, Sequence
 import json
 
 from ..types.completion import (
@@ -24,15 +24,18 @@ from ..types.completion import (
     CompletionChunk,
 )
 from ..logging import get_logger
-from ..exceptions import APIError
+from ..utils import avalidate_json, StreamChunkParser
 
 if TYPE_CHECKING:
     from ..client import SynapsAI, AsyncSynapsAI
 
 logger = get_logger(__name__)
 
+
 class CompletionsResource:
     """Chat completions resource"""
+
+    __slots__ = ("_client",)
     
     def __init__(self, client: "SynapsAI"):
         self._client = client
@@ -45,8 +48,8 @@ class CompletionsResource:
         top_p: float = 1.0,
         n: int = 1,
         stream: bool = False,
-        stop = [],
-        max_completion_tokens = 128,
+        stop: Optional[Union[str, Sequence[str]]] = None,
+        max_completion_tokens: int = 128,
         presence_penalty: float = 0.0,
         frequency_penalty: float = 0.0,
         logit_bias: Optional[Dict[int, float]] = None,
@@ -76,31 +79,20 @@ class CompletionsResource:
             return self._stream_completions(endpoint, request_data)
         else:
             response = self._client._post(endpoint, request_data)
-            return CompletionResponse.model_validate(response.json())
+            return CompletionResponse.model_validate_json(response.content)
 
     def _stream_completions(self, endpoint, request_data) -> Iterator[CompletionChunk]:
-        for chunk_data in self._client._stream_response(endpoint, request_data):
-            try:
-                error = chunk_data.get("error")
-                if error:
-                    raise APIError(error)
-                yield CompletionChunk(**chunk_data)
-            except APIError as e:
-                raise e
-            except Exception as e:
-                print(e)
-                logger.warning(
-                    "Failed to parse CompletionChunk",
-                    exc_info=True,
-                    extra={"endpoint": endpoint},
-                )
-                continue
-
-
+        with StreamChunkParser(CompletionChunk, endpoint, logger) as parse:
+            for payload in self._client._stream_response(endpoint, request_data, raw=True):
+                chunk = parse(payload)
+                if chunk is not None:
+                    yield chunk
 
 
 class AsyncCompletionsResource:
     """Async chat completions resource"""
+
+    __slots__ = ("_client",)
     
     def __init__(self, client: "AsyncSynapsAI"):
         self._client = client
@@ -113,11 +105,11 @@ class AsyncCompletionsResource:
         top_p: float = 1.0,
         n: int = 1,
         stream: bool = False,
-        stop = [],
-        max_completion_tokens = 128,
+        stop: Optional[Union[str, Sequence[str]]] = None,
+        max_completion_tokens: int = 128,
         presence_penalty: float = 0.0,
         frequency_penalty: float = 0.0,
-        logit_bias = None,
+        logit_bias: Optional[Dict[int, float]] = None,
         **kwargs
     ) -> Union[CompletionResponse, AsyncIterator[CompletionChunk]]:
         """Create a chat completion asynchronously"""
@@ -145,18 +137,11 @@ class AsyncCompletionsResource:
             return self._stream_completions(endpoint, request_data)
         else:
             response = await self._client._post(endpoint, request_data)
-            return CompletionResponse.model_validate(response.json())
+            return await avalidate_json(CompletionResponse, response.content)
     
     async def _stream_completions(self, endpoint, request_data) -> AsyncIterator[CompletionChunk]:
-        async for chunk_data in self._client._stream_response(endpoint, request_data):
-            try:
-                yield CompletionChunk(**chunk_data)
-            except Exception as e:
-                logger.warning(
-                    "Failed to parse CompletionChunk",
-                    exc_info=True,
-                    extra={"endpoint": endpoint},
-                )
-                continue
-
-
+        with StreamChunkParser(CompletionChunk, endpoint, logger) as parse:
+            async for payload in self._client._stream_response(endpoint, request_data, raw=True):
+                chunk = parse(payload)
+                if chunk is not None:
+                    yield chunk
@@ -17,31 +17,266 @@ Embeddings resource handlers
 """
 
 from typing import Union, List, TYPE_CHECKING, Literal, Optional
+from array import array
+from collections import OrderedDict
+from operator import attrgetter
+import asyncio
+import base64
+import hashlib
+import math
+import sys
+import threading
 
 from ..types.embeddings import (
     EmbeddingResponse,
     SimilarityResponse,
 )
 from ..exceptions import APIError
-import math
+from ..utils import avalidate_json
+
+try:
+    import simsimd
+except ImportError:  # simsimd is an optional speedup (`pip install synapsai-python[fast]`)
+    simsimd = None
 
 if TYPE_CHECKING:
     from ..client import SynapsAI, AsyncSynapsAI
 
 
-def _dot_product(a: List[float], b: List[float]) -> float:
-    return sum(x * y for x, y in zip(a, b))
+def _dot_and_square_norm(a: List[float], b: List[float]):
+    """Return `a . b` and `b . b`, accumulated in a single pass over both vectors"""
+    dot = square_norm = 0.0
+    for x, y in zip(a, b):
+        dot += x * y
+        square_norm += y * y
+    return dot, square_norm
 
 
 def _vector_norm(a: List[float]) -> float:
     return math.sqrt(sum(x * x for x in a))
 
 
-def _cosine_similarity(a: List[float], b: List[float]) -> float:
-    denom = _vector_norm(a) * _vector_norm(b)
-    if denom == 0:
-        return 0.0
-    return _dot_product(a, b) / denom
+def _decode_embedding(embedding: Union[List[float], str]) -> Union[List[float], array]:
+    """Decode a base64 embedding (little-endian float32); float lists are returned as-is"""
+    if isinstance(embedding, str):
+        values = array("f", base64.b64decode(embedding))
+        if sys.byteorder == "big":
+            values.byteswap()
+        return values
+    return embedding
+
+
+def _as_float_list(vector) -> List[float]:
+    """Return a float list for a plain list, an `array` or a numpy row"""
+    return vector if isinstance(vector, list) else vector.tolist()
+
+
+def _as_float32(vector) -> array:
+    """Return `vector` as a float32 `array` (a buffer the SIMD kernels can read)"""
+    return vector if isinstance(vector, array) and vector.typecode == "f" else array("f", vector)
+
+
+def _cosine_similarities(source, others) -> List[float]:
+    """Cosine similarity of `source` against each of `others` (0.0 where a norm is zero)"""
+    if simsimd is not None:
+        # SimSIMD scores two zero vectors as identical, so zero norms are handled here.
+        # any() stops at the first non-zero component, so this is cheap for real embeddings.
+        if not any(source):
+            return [0.0] * len(others)
+        # Fused SIMD dot product and norms straight from the float32 buffers, no numpy needed
+        source = _as_float32(source)
+        return [
+            1.0 - simsimd.cosine(source, _as_float32(other)) if any(other) else 0.0
+            for other in others
+        ]
+
+    # The source norm is shared by every pair, so compute it once
+    source_norm = _vector_norm(source)
+    sims = []
+    for other in others:
+        dot, square_norm = _dot_and_square_norm(source, other)
+        denom = source_norm * math.sqrt(square_norm)
+        sims.append(dot / denom if denom else 0.0)
+    return sims
+
+
+def _matrix_cosine_similarities(np, source, others) -> List[float]:
+    """numpy variant of `_cosine_similarities` for a source row and a matrix of candidate rows"""
+    source_norm = math.sqrt(float(np.dot(source, source)))
+    if source_norm == 0:
+        return [0.0] * len(others)
+
+    if simsimd is not None:
+        # SIMD kernels compute every distance in one pass, without intermediate norm arrays
+        distances = np.asarray(simsimd.cdist(source[np.newaxis, :], others, metric="cosine")).ravel()
+        return (1.0 - distances).tolist()
+
+    # One matrix-vector product instead of a Python loop per embedding
+    dots = others @ source
+    denoms = np.sqrt(np.einsum("ij,ij->i", others, others)) * source_norm
+    sims = np.divide(dots, denoms, out=np.zeros_like(dots), where=denoms != 0)
+    return sims.tolist()
+
+
+# Async similarity splits larger uncached inputs into concurrent requests of this many texts
+_SIMILARITY_BATCH_SIZE = 256
+_SIMILARITY_BATCH_CONCURRENCY = 8
+
+# Async similarity scores embedding matrices larger than this (in float32 bytes) on a worker thread
+_THREADED_SIMILARITY_NBYTES = 256 * 1024
+
+
+def _embedding_nbytes(emb_response: EmbeddingResponse) -> int:
+    """Approximate float32 size of the embeddings in `emb_response`, without decoding them"""
+    nbytes = 0
+    for item in emb_response.data:
+        embedding = item.embedding
+        # Four base64 characters carry three bytes
+        nbytes += len(embedding) * 3 // 4 if isinstance(embedding, str) else len(embedding) * 4
+    return nbytes
+
+
+def _merge_embedding_responses(responses: List[EmbeddingResponse]) -> EmbeddingResponse:
+    """Concatenate batched embedding responses, re-indexing each batch after the previous ones"""
+    data = []
+    for response in responses:
+        offset = len(data)
+        data.extend(
+            {"embedding": item.embedding, "index": offset + item.index}
+            for item in response.data
+        )
+    usages = [response.usage for response in responses]
+    usage = None
+    if all(usages):
+        usage = {
+            "prompt_tokens": sum(u.prompt_tokens for u in usages),
+            "total_tokens": sum(u.total_tokens for u in usages),
+        }
+    return EmbeddingResponse(data=data, model=responses[0].model, usage=usage)
+
+
+def _similarity_response(
+    emb_response: EmbeddingResponse, return_embeddings: bool, encoding_format: Optional[str]
+) -> SimilarityResponse:
+    """Score the embeddings of `[source_sentence, *sentences]` against the first one"""
+    data = emb_response.data if emb_response else None
+    if not data:
+        raise APIError("Failed to obtain embeddings")
+
+    # Sort by index to guarantee alignment with input order
+    sorted_data = sorted(data, key=attrgetter("index"))
+    try:
+        import numpy as np
+    except ImportError:  # numpy is optional; fall back to the pure Python version
+        vectors = [_decode_embedding(item.embedding) for item in sorted_data]
+        sims = _cosine_similarities(vectors[0], vectors[1:])
+    else:
+        # Rows of the (index-ordered) float32 matrix line up with sorted_data
+        vectors = emb_response.matrix
+        sims = _matrix_cosine_similarities(np, vectors[0], vectors[1:])
+
+    # Rows are in input order, so a sentence's position is its index. The constant
+    # "object" field (and "embedding" when not requested) is left to the model defaults.
+    if return_embeddings:
+        # Embeddings are fetched as base64; hand them back in the format the caller asked for
+        if encoding_format == "base64":
+            embeddings = [item.embedding for item in sorted_data[1:]]
+        else:
+            embeddings = [_as_float_list(vector) for vector in vectors[1:]]
+        results = [
+            {"similarity": sim, "embedding": embedding, "index": i}
+            for i, (sim, embedding) in enumerate(zip(sims, embeddings))
+        ]
+    else:
+        results = [{"similarity": sim, "index": i} for i, sim in enumerate(sims)]
+
+    response_obj = {
+        "object": "list",
+        "data": results,
+        "model": emb_response.model,
+        "usage": emb_response.usage,
+    }
+
+    return SimilarityResponse.model_validate(response_obj)
+
+
+class _EmbeddingCache:
+    """Bounded LRU of embeddings keyed by (model, request options, SHA-256 of the text)"""
+
+    def __init__(self, maxsize: int):
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[tuple, Union[List[float], str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def keys(model: str, inputs: List[str], kwargs: dict) -> Optional[List[tuple]]:
+        """Cache keys for `inputs`, or None when the request options can't be part of a key"""
+        options = tuple(sorted(kwargs.items()))
+        try:
+            hash(options)
+        except TypeError:
+            return None
+        return [(model, options, hashlib.sha256(text.encode("utf-8")).digest()) for text in inputs]
+
+    def get_many(self, keys: List[tuple]) -> List[Optional[Union[List[float], str]]]:
+        with self._lock:
+            found = []
+            for key in keys:
+                embedding = self._entries.get(key)
+                if embedding is not None:
+                    self._entries.move_to_end(key)
+                found.append(embedding)
+            return found
+
+    def put_many(self, items) -> None:
+        with self._lock:
+            for key, embedding in items:
+                self._entries[key] = embedding
+                self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+
+class _CacheLookup:
+    """Split similarity inputs into cached embeddings and the distinct texts that still need fetching"""
+
+    __slots__ = ("cache", "model", "inputs", "keys", "found", "missing")
+
+    def __init__(self, cache: Optional[_EmbeddingCache], model: str, inputs: List[str], kwargs: dict):
+        self.cache = cache
+        self.model = model
+        self.inputs = inputs
+        self.keys = cache.keys(model, inputs, kwargs) if cache is not None else None
+        if self.keys is None:
+            self.found = None
+            self.missing = inputs
+            return
+        self.found = cache.get_many(self.keys)
+        self.missing = list(dict.fromkeys(text for text, hit in zip(inputs, self.found) if hit is None))
+
+    def complete(self, fetched: Optional[EmbeddingResponse]) -> EmbeddingResponse:
+        """Combine cached embeddings with the `fetched` ones (in input order) and cache the new ones"""
+        if self.found is None:
+            return fetched
+
+        fresh = {}
+        if fetched is not None:
+            if len(fetched.data) != len(self.missing):
+                raise APIError("Failed to obtain embeddings")
+            fetched_data = sorted(fetched.data, key=attrgetter("index"))
+            fresh = {text: item.embedding for text, item in zip(self.missing, fetched_data)}
+            self.cache.put_many((key, fresh[text]) for key, text in zip(self.keys, self.inputs) if text in fresh)
+
+        data = [
+            {"embedding": hit if hit is not None else fresh[text], "index": i}
+            for i, (text, hit) in enumerate(zip(self.inputs, self.found))
+        ]
+        # Usage only covers the embeddings that were actually requested
+        return EmbeddingResponse(
+            data=data,
+            model=fetched.model if fetched is not None else self.model,
+            usage=fetched.usage if fetched is not None else None,
+        )
 
 
 class EmbeddingsResource:
@@ -49,6 +284,7 @@ class EmbeddingsResource:
     
     def __init__(self, client: "SynapsAI"):
         self._client = client
+        self._cache = _EmbeddingCache(client.embedding_cache_size) if client.embedding_cache_size > 0 else None
     
     def create(
         self,
@@ -71,8 +307,7 @@ class EmbeddingsResource:
         
         # Make request
         response = self._client._post(endpoint, json_data=request_data)
-        response_data = response.json()
-        return EmbeddingResponse.model_validate(response_data)
+        return EmbeddingResponse.model_validate_json(response.content)
 
     def similarity(
         self,
@@ -91,48 +326,26 @@ class EmbeddingsResource:
         # Build inputs: first element is source_sentence followed by other sentences
         inputs = [source_sentence] + sentences
 
-        # Call create to get embeddings
-        emb_response = self.create(
-            model=model,
-            input=inputs,
-            encoding_format=encoding_format,
-            **kwargs,
-        )
-
-        # Validate response
-        if not emb_response or not getattr(emb_response, "data", None):
-            raise APIError("Failed to obtain embeddings")
-
-        # Sort by index to guarantee alignment with input order
-        sorted_data = sorted(emb_response.data, key=lambda x: x.index)
-
-        source_emb = sorted_data[0].embedding  # now guaranteed to be source_sentence
-
-        results = []
-        for item in sorted_data[1:]:
-            sim = _cosine_similarity(source_emb, item.embedding)
-            result_obj = {
-                "object": "similarity",
-                "similarity": float(sim),
-                "embedding": item.embedding if return_embeddings else None,
-                "index": int(item.index - 1),
-            }
-            results.append(result_obj)
-
-        response_obj = {
-            "object": "list",
-            "data": results,
-            "model": emb_response.model,
-            "usage": getattr(emb_response, "usage", None),
-        }
+        # Call create to get embeddings (only for sentences not already cached)
+        lookup = _CacheLookup(self._cache, model, inputs, kwargs)
+        emb_response = None
+        if lookup.missing:
+            emb_response = self.create(
+                model=model,
+                input=lookup.missing,
+                # base64 is ~4x smaller on the wire and decodes without per-float parsing
+                encoding_format="base64",
+                **kwargs,
+            )
 
-        return SimilarityResponse.model_validate(response_obj)
+        return _similarity_response(lookup.complete(emb_response), return_embeddings, encoding_format)
 
 class AsyncEmbeddingsResource:
     """Async embeddings resource handler"""
     
     def __init__(self, client: "AsyncSynapsAI"):
         self._client = client
+        self._cache = _EmbeddingCache(client.embedding_cache_size) if client.embedding_cache_size > 0 else None
     
     async def create(
         self,
@@ -155,8 +368,27 @@ class AsyncEmbeddingsResource:
         
         # Make request
         response = await self._client._post(endpoint, json_data=request_data)
-        response_data = response.json()
-        return EmbeddingResponse.model_validate(response_data) 
+        return await avalidate_json(EmbeddingResponse, response.content) 
+
+    async def _create_batched(self, model: str, texts: List[str], **kwargs) -> EmbeddingResponse:
+        """
+        Embed `texts` as base64, splitting long lists into concurrent requests of
+        `_SIMILARITY_BATCH_SIZE` texts that are merged back in input order.
+        """
+        batches = [texts[i:i + _SIMILARITY_BATCH_SIZE] for i in range(0, len(texts), _SIMILARITY_BATCH_SIZE)]
+        semaphore = asyncio.Semaphore(_SIMILARITY_BATCH_CONCURRENCY)
+
+        async def create_one(batch):
+            async with semaphore:
+                # base64 is ~4x smaller on the wire and decodes without per-float parsing
+                return await self.create(model=model, input=batch, encoding_format="base64", **kwargs)
+
+        if len(batches) == 1:
+            return await create_one(batches[0])
+        responses = await asyncio.gather(*(create_one(batch) for batch in batches))
+        if not all(response.data for response in responses):
+            raise APIError("Failed to obtain embeddings")
+        return _merge_embedding_responses(responses)
 
     async def similarity(
         self,
@@ -174,34 +406,13 @@ class AsyncEmbeddingsResource:
 
         inputs = [source_sentence] + sentences
 
-        emb_response = await self.create(
-            model=model,
-            input=inputs,
-            encoding_format=encoding_format,
-            **kwargs,
-        )
-
-        if not emb_response or not getattr(emb_response, "data", None):
-            raise APIError("Failed to obtain embeddings")
-
-        source_emb = emb_response.data[0].embedding
-
-        results = []
-        for item in emb_response.data[1:]:
-            sim = _cosine_similarity(source_emb, item.embedding)
-            result_obj = {
-                "object": "similarity",
-                "similarity": float(sim),
-                "embedding": item.embedding if return_embeddings else None,
-                "index": int(item.index - 1),
-            }
-            results.append(result_obj)
-
-        response_obj = {
-            "object": "list",
-            "data": results,
-            "model": emb_response.model,
-            "usage": getattr(emb_response, "usage", None),
-        }
+        lookup = _CacheLookup(self._cache, model, inputs, kwargs)
+        emb_response = None
+        if lookup.missing:
+            emb_response = await self._create_batched(model, lookup.missing, **kwargs)
 
-        return SimilarityResponse.model_validate(response_obj)
\ No newline at end of file
+        emb_response = lookup.complete(emb_response)
+        if emb_response and emb_response.data and _embedding_nbytes(emb_response) > _THREADED_SIMILARITY_NBYTES:
+            # Keep the event loop responsive while large matrices are decoded and scored
+            return await asyncio.to_thread(_similarity_response, emb_response, return_embeddings, encoding_format)
+        return _similarity_response(emb_response, return_embeddings, encoding_format)
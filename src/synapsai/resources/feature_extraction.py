@@ -48,8 +48,7 @@ class FeatureExtractionResource:
         endpoint = "feature-extraction"
         
         response = self._client._post(endpoint, json_data=request_data)
-        response_data = response.json()
-        return FeatureExtractionResponse.model_validate(response_data)
+        return FeatureExtractionResponse.model_validate_json(response.content)
 
 class AsyncFeatureExtractionResource:
     """Feature extraction resource handler"""
@@ -76,5 +75,4 @@ class AsyncFeatureExtractionResource:
         endpoint = "feature-extraction"
         
         response = await self._client._post(endpoint, json_data=request_data)
-        response_data = response.json()
-        return FeatureExtractionResponse.model_validate(response_data)
\ No newline at end of file
+        return FeatureExtractionResponse.model_validate_json(response.content)
\ No newline at end of file
@@ -52,8 +52,7 @@ class FillMaskResource:
         endpoint = "fill-mask"
         
         response = self._client._post(endpoint, json_data=request_data)
-        response_data = response.json()
-        return FillMaskResponse.model_validate(response_data)
+        return FillMaskResponse.model_validate_json(response.content)
 
 class AsyncFillMaskResource:
     """Fill mask resource handler"""
@@ -84,5 +83,4 @@ class AsyncFillMaskResource:
         endpoint = "fill-mask"
         
         response = await self._client._post(endpoint, json_data=request_data)
-        response_data = response.json()
-        return FillMaskResponse.model_validate(response_data)
\ No newline at end of file
+        return FillMaskResponse.model_validate_json(response.content)
\ No newline at end of file
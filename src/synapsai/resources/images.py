@@ -16,6 +16,7 @@
 Images resource handlers
 """
 
+import asyncio
 from typing import TYPE_CHECKING, Optional, Dict
 
 from ..types.images import (
@@ -43,6 +44,8 @@ if TYPE_CHECKING:
 
 class ImagesResource:
     """Images resource handler"""
+
+    __slots__ = ("_client",)
     
     def __init__(self, client: "SynapsAI"):
         self._client = client
@@ -76,8 +79,7 @@ class ImagesResource:
         endpoint = "images/generations"
         
         response = self._client._post(endpoint, json_data=request_data)
-        response_data = response.json()
-        return ImageGenerateResponse.model_validate(response_data)
+        return ImageGenerateResponse.model_validate_json(response.content)
     
     def edit(
         self,
@@ -95,8 +97,9 @@ class ImagesResource:
         """Edit images with prompts"""
         
         # Handle image input (file path, bytes, or base64)
-        image_data = process_image_input(image)
-        mask_data = process_image_input(mask) if mask else None
+        # Image and mask are read and encoded concurrently on the shared I/O pool
+        image_data, mask_data = process_image_input([image, mask])
+        mask_data = mask_data or None
         
         # Build request
         request_data = self._client._build_request(
@@ -116,8 +119,7 @@ class ImagesResource:
         endpoint = "images/edits"
         
         response = self._client._post(endpoint, json_data=request_data)
-        response_data = response.json()
-        return ImageEditResponse.model_validate(response_data)
+        return ImageEditResponse.model_validate_json(response.content)
     
     def to_text(
         self,
@@ -147,8 +149,7 @@ class ImagesResource:
         endpoint = "images/to-text"
         
         response = self._client._post(endpoint, json_data=request_data)
-        response_data = response.json()
-        return ImageAnalysisResponse.model_validate(response_data)
+        return ImageAnalysisResponse.model_validate_json(response.content)
 
     def feature_extraction(
         self,
@@ -172,8 +173,7 @@ class ImagesResource:
         endpoint = "images/feature-extraction"
         
         response = self._client._post(endpoint, json_data=request_data)
-        response_data = response.json()
-        return ImageFeatureExtractionResponse.model_validate(response_data)
+        return ImageFeatureExtractionResponse.model_validate_json(response.content)
 
     def segmentation(
         self,
@@ -205,8 +205,7 @@ class ImagesResource:
         endpoint = "images/segmentation"
         
         response = self._client._post(endpoint, json_data=request_data)
-        response_data = response.json()
-        return ImageAnalysisResponse.model_validate(response_data)
+        return ImageAnalysisResponse.model_validate_json(response.content)
 
     def depth_estimation(
         self,
@@ -232,8 +231,7 @@ class ImagesResource:
         endpoint = "images/depth-estimation"
         
         response = self._client._post(endpoint, json_data=request_data)
-        response_data = response.json()
-        return DepthEstimationResponse.model_validate(response_data)
+        return DepthEstimationResponse.model_validate_json(response.content)
 
     def object_detection(
         self,
@@ -259,8 +257,7 @@ class ImagesResource:
         endpoint = "images/object-detection"
         
         response = self._client._post(endpoint, json_data=request_data)
-        response_data = response.json()
-        return ObjectDetectionResponse.model_validate(response_data)
+        return ObjectDetectionResponse.model_validate_json(response.content)
 
     def mask_generation(
         self,
@@ -297,11 +294,12 @@ class ImagesResource:
         endpoint = "images/mask-generation"
 
         response = self._client._post(endpoint, json_data=request_data)
-        response_data = response.json()
-        return MaskGenerationResponse.model_validate(response_data)
+        return MaskGenerationResponse.model_validate_json(response.content)
 
 class AsyncImagesResource:
     """Async images resource handler"""
+
+    __slots__ = ("_client",)
     
     def __init__(self, client: "AsyncSynapsAI"):
         self._client = client
@@ -335,8 +333,7 @@ class AsyncImagesResource:
         endpoint = "images/generations"
         
         response = await self._client._post(endpoint, json_data=request_data)
-        response_data = response.json()
-        return ImageGenerateResponse.model_validate(response_data)
+        return ImageGenerateResponse.model_validate_json(response.content)
     
     async def edit(
         self,
@@ -354,8 +351,9 @@ class AsyncImagesResource:
         """Edit images with prompts asynchronously"""
         
         # Handle image input
-        image_data = process_image_input(image)
-        mask_data = process_image_input(mask) if mask else None
+        # Image and mask are read and encoded concurrently on the shared I/O pool
+        image_data, mask_data = await asyncio.to_thread(process_image_input, [image, mask])
+        mask_data = mask_data or None
         
         # Build request
         request_data = self._client._build_request(
@@ -375,8 +373,7 @@ class AsyncImagesResource:
         endpoint = "images/edits"
         
         response = await self._client._post(endpoint, json_data=request_data)
-        response_data = response.json()
-        return ImageEditResponse.model_validate(response_data)
+        return ImageEditResponse.model_validate_json(response.content)
     
     async def to_text(
         self,
@@ -390,7 +387,7 @@ class AsyncImagesResource:
         """Analyze images and extract information asynchronously (custom endpoint)"""
         
         # Handle image input
-        inputs_data = process_image_input(inputs)
+        inputs_data = await asyncio.to_thread(process_image_input, inputs)
         
         # Build request
         request_data = self._client._build_request(
@@ -403,11 +400,10 @@ class AsyncImagesResource:
         )
         
         # Make request
-        endpoint = "/images/to-text"
+        endpoint = "images/to-text"
         
         response = await self._client._post(endpoint, json_data=request_data)
-        response_data = response.json()
-        return ImageAnalysisResponse.model_validate(response_data)
+        return ImageAnalysisResponse.model_validate_json(response.content)
 
     async def feature_extraction(
         self,
@@ -418,7 +414,7 @@ class AsyncImagesResource:
         """Extract features from images"""
         
         # Handle image input
-        image_data = process_image_input(inputs)
+        image_data = await asyncio.to_thread(process_image_input, inputs)
         
         # Build request
         request_data = self._client._build_request(
@@ -430,9 +426,9 @@ class AsyncImagesResource:
         # Make request
         endpoint = "images/feature-extraction"
         
-        response = await self._client._post(endpoint, json_data=request_data)
-        response_data = response.json()
-        return ImageFeatureExtractionResponse.model_validate(response_data)
+        # Deterministic analysis: identical concurrent calls share one HTTP request
+        response = await self._client._post(endpoint, json_data=request_data, idempotent=True)
+        return ImageFeatureExtractionResponse.model_validate_json(response.content)
 
     async def segmentation(
         self,
@@ -447,7 +443,7 @@ class AsyncImagesResource:
         """Analyze images and extract information."""
         
         # Handle image input
-        image_data = process_image_input(inputs)
+        image_data = await asyncio.to_thread(process_image_input, inputs)
         
         # Build request
         request_data = self._client._build_request(
@@ -463,9 +459,9 @@ class AsyncImagesResource:
         # Make request
         endpoint = "images/segmentation"
         
-        response = await self._client._post(endpoint, json_data=request_data)
-        response_data = response.json()
-        return ImageAnalysisResponse.model_validate(response_data)
+        # Deterministic analysis: identical concurrent calls share one HTTP request
+        response = await self._client._post(endpoint, json_data=request_data, idempotent=True)
+        return ImageAnalysisResponse.model_validate_json(response.content)
 
     async def depth_estimation(
         self,
@@ -477,7 +473,7 @@ class AsyncImagesResource:
         """Analyze images and extract information."""
         
         # Handle image input
-        image_data = process_image_input(inputs)
+        image_data = await asyncio.to_thread(process_image_input, inputs)
         
         # Build request
         request_data = self._client._build_request(
@@ -490,9 +486,9 @@ class AsyncImagesResource:
         # Make request
         endpoint = "images/depth-estimation"
         
-        response = await self._client._post(endpoint, json_data=request_data)
-        response_data = response.json()
-        return DepthEstimationResponse.model_validate(response_data)
+        # Deterministic analysis: identical concurrent calls share one HTTP request
+        response = await self._client._post(endpoint, json_data=request_data, idempotent=True)
+        return DepthEstimationResponse.model_validate_json(response.content)
 
     async def object_detection(
         self,
@@ -504,7 +500,7 @@ class AsyncImagesResource:
         """Analyze images and extract information."""
         
         # Handle image input
-        image_data = process_image_input(inputs)
+        image_data = await asyncio.to_thread(process_image_input, inputs)
         
         # Build request
         request_data = self._client._build_request(
@@ -517,9 +513,9 @@ class AsyncImagesResource:
         # Make request
         endpoint = "images/object-detection"
         
-        response = await self._client._post(endpoint, json_data=request_data)
-        response_data = response.json()
-        return ObjectDetectionResponse.model_validate(response_data)
+        # Deterministic analysis: identical concurrent calls share one HTTP request
+        response = await self._client._post(endpoint, json_data=request_data, idempotent=True)
+        return ObjectDetectionResponse.model_validate_json(response.content)
 
     async def mask_generation(
         self,
@@ -537,7 +533,7 @@ class AsyncImagesResource:
     ) -> MaskGenerationResponse:
         """Generate masks from images"""
         
-        image_data = process_image_input(image)
+        image_data = await asyncio.to_thread(process_image_input, image)
         
         request_data = self._client._build_request(
             model=model,
@@ -555,6 +551,6 @@ class AsyncImagesResource:
 
         endpoint = "images/mask-generation"
 
-        response = await self._client._post(endpoint, json_data=request_data)
-        response_data = response.json()
-        return MaskGenerationResponse.model_validate(response_data)
\ No newline at end of file
+        # Deterministic analysis: identical concurrent calls share one HTTP request
+        response = await self._client._post(endpoint, json_data=request_data, idempotent=True)
+        return MaskGenerationResponse.model_validate_json(response.content)
\ No newline at end of file
@@ -33,14 +33,13 @@ class ModelsResource:
         self._client = client
     
     def list(self) -> Models:
-        """Get available models."""
+        """Get available models. Results are cached for the client's `cache_ttl`."""
         
         # Make request
         endpoint = "models"
         
-        response = self._client._get(endpoint)
-        response_data = response.json()
-        return Models.model_validate(response_data)
+        response = self._client._get(endpoint, cached=True)
+        return Models.model_validate_json(response.content)
 
     def retrieve(self, model: str) -> Model:
         """Retrieve a model."""
@@ -49,8 +48,7 @@ class ModelsResource:
         endpoint = f"models/{model}"
 
         response = self._client._get(endpoint)
-        response_data = response.json()
-        return Model.model_validate(response_data)
+        return Model.model_validate_json(response.content)
 
 class AsyncModelsResource:
     """Async images resource handler"""
@@ -59,14 +57,13 @@ class AsyncModelsResource:
         self._client = client
     
     async def list(self) -> Models:
-        """Get available models."""
+        """Get available models. Results are cached for the client's `cache_ttl`."""
         
         # Make request
         endpoint = "models"
         
-        response = await self._client._get(endpoint)
-        response_data = response.json()
-        return Models.model_validate(response_data)
+        response = await self._client._get(endpoint, cached=True)
+        return Models.model_validate_json(response.content)
 
     async def retrieve(self, model: str) -> Model:
         """Retrieve a model."""
@@ -75,6 +72,5 @@ class AsyncModelsResource:
         endpoint = f"models/{model}"
 
         response = await self._client._get(endpoint)
-        response_data = response.json()
-        return Model.model_validate(response_data)
+        return Model.model_validate_json(response.content)
     
\ No newline at end of file
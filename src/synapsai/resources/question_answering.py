@@ -72,7 +72,7 @@ class QuestionAnsweringResource:
         )
         endpoint = "question-answering/document"
         response = self._client._post(endpoint, json_data=request_data)
-        return DocumentQuestionAnsweringResponse.model_validate(response.json())
+        return DocumentQuestionAnsweringResponse.model_validate_json(response.content)
     
     def text(
         self,
@@ -101,7 +101,7 @@ class QuestionAnsweringResource:
         )
         endpoint = "question-answering"
         response = self._client._post(endpoint, json_data=request_data)
-        return QuestionAnsweringResponse.model_validate(response.json())
+        return QuestionAnsweringResponse.model_validate_json(response.content)
     
     def table(
         self,
@@ -122,7 +122,7 @@ class QuestionAnsweringResource:
         )
         endpoint = "question-answering/table"
         response = self._client._post(endpoint, json_data=request_data)
-        return TableQuestionAnsweringResponse.model_validate(response.json())
+        return TableQuestionAnsweringResponse.model_validate_json(response.content)
     
     def visual(
         self,
@@ -141,7 +141,7 @@ class QuestionAnsweringResource:
         )
         endpoint = "question-answering/visual"
         response = self._client._post(endpoint, json_data=request_data)
-        return VisualQuestionAnsweringResponse.model_validate(response.json())
+        return VisualQuestionAnsweringResponse.model_validate_json(response.content)
 
 
 class AsyncQuestionAnsweringResource:
@@ -183,7 +183,7 @@ class AsyncQuestionAnsweringResource:
         )
         endpoint = "question-answering/document"
         response = await self._client._post(endpoint, json_data=request_data)
-        return DocumentQuestionAnsweringResponse.model_validate(response.json())
+        return DocumentQuestionAnsweringResponse.model_validate_json(response.content)
 
     async def text(
         self,
@@ -212,7 +212,7 @@ class AsyncQuestionAnsweringResource:
         )
         endpoint = "question-answering"
         response = await self._client._post(endpoint, json_data=request_data)
-        return QuestionAnsweringResponse.model_validate(response.json())
+        return QuestionAnsweringResponse.model_validate_json(response.content)
 
     async def table(
         self,
@@ -233,7 +233,7 @@ class AsyncQuestionAnsweringResource:
         )
         endpoint = "question-answering/table"
         response = await self._client._post(endpoint, json_data=request_data)
-        return TableQuestionAnsweringResponse.model_validate(response.json())
+        return TableQuestionAnsweringResponse.model_validate_json(response.content)
 
     async def visual(
         self,
@@ -252,6 +252,6 @@ class AsyncQuestionAnsweringResource:
         )
         endpoint = "question-answering/visual"
         response = await self._client._post(endpoint, json_data=request_data)
-        return VisualQuestionAnsweringResponse.model_validate(response.json())
+        return VisualQuestionAnsweringResponse.model_validate_json(response.content)
 
 
@@ -53,8 +53,7 @@ class RerankResource:
         endpoint = "rerank"
 
         response = self._client._post(endpoint, json_data=request_data)
-        response_data = response.json()
-        return RerankResponse.model_validate(response_data)
+        return RerankResponse.model_validate_json(response.content)
 
 
 class AsyncRerankResource:
@@ -86,5 +85,4 @@ class AsyncRerankResource:
         endpoint = "rerank"
 
         response = await self._client._post(endpoint, json_data=request_data)
-        response_data = response.json()
-        return RerankResponse.model_validate(response_data)
+        return RerankResponse.model_validate_json(response.content)
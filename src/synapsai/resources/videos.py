@@ -148,15 +148,15 @@ class VideosResource:
             **kwargs,
         )
         response = self._client._post("videos", json_data=request_data)
-        return Video.model_validate(response.json())
+        return Video.model_validate_json(response.content)
 
     def retrieve(self, video_id: str) -> Video:
         response = self._client._get(f"videos/{video_id}")
-        return Video.model_validate(response.json())
+        return Video.model_validate_json(response.content)
 
     def delete(self, video_id: str) -> VideoDeleteResponse:
         response = self._client._delete(f"videos/{video_id}")
-        return VideoDeleteResponse.model_validate(response.json())
+        return VideoDeleteResponse.model_validate_json(response.content)
 
     def download_content(
         self,
@@ -237,7 +237,7 @@ class AsyncVideosResource:
     ) -> Video:
         request_data = self._client._build_request(
             prompt=prompt,
-            input_reference=process_image_input(input_reference),
+            input_reference=await asyncio.to_thread(process_image_input, input_reference),
             model=model,
             seconds=seconds,
             size=size,
@@ -247,15 +247,15 @@ class AsyncVideosResource:
             **kwargs,
         )
         response = await self._client._post("videos", json_data=request_data)
-        return Video.model_validate(response.json())
+        return Video.model_validate_json(response.content)
 
     async def retrieve(self, video_id: str) -> Video:
         response = await self._client._get(f"videos/{video_id}")
-        return Video.model_validate(response.json())
+        return Video.model_validate_json(response.content)
 
     async def delete(self, video_id: str) -> VideoDeleteResponse:
         response = await self._client._delete(f"videos/{video_id}")
-        return VideoDeleteResponse.model_validate(response.json())
+        return VideoDeleteResponse.model_validate_json(response.content)
 
     async def download_content(
         self,
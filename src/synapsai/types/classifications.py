@@ -16,11 +16,17 @@
 Classification type definitions
 """
 
-from typing import Optional, Dict, Any, Union, List, Literal
+from typing import TYPE_CHECKING, Optional, Dict, Any, Union, List, Literal
 from pydantic import BaseModel, Field, ConfigDict
 from enum import Enum
-from numpy import ndarray
-from PIL.Image import Image as PilImage
+
+if TYPE_CHECKING:
+    from numpy import ndarray
+    from PIL.Image import Image as PilImage
+else:
+    # numpy and PIL are only needed by callers who pass arrays or images; don't import them with the SDK
+    ndarray = Any
+    PilImage = Any
 
 from .common import APIResponse, Usage
 
@@ -16,9 +16,14 @@
 Embeddings type definitions
 """
 
-from typing import Optional, List, Literal, Union
+import base64
+from functools import cached_property
+from typing import TYPE_CHECKING, Optional, List, Literal, Union
 from pydantic import BaseModel, Field
 
+if TYPE_CHECKING:
+    import numpy as np
+
 from .common import APIResponse, Usage
 
 
@@ -44,6 +49,26 @@ class EmbeddingResponse(APIResponse):
     model: str
     usage: Optional[Usage] = None
 
+    @cached_property
+    def matrix(self) -> "np.ndarray":
+        """All embeddings as one contiguous float32 array of shape (n, dimensions), in input order. Requires numpy."""
+        import numpy as np
+
+        data = sorted(self.data, key=lambda e: e.index)
+        encoded = [isinstance(e.embedding, str) for e in data]
+        if data and all(encoded):
+            # base64 embeddings are little-endian float32 already; decode straight into one buffer
+            raw = b"".join(base64.b64decode(e.embedding) for e in data)
+            return np.frombuffer(raw, dtype="<f4").reshape(len(data), -1)
+        if any(encoded):
+            # Mixed rows (e.g. cached float rows merged with freshly fetched base64 ones)
+            rows = [
+                np.frombuffer(base64.b64decode(e.embedding), dtype="<f4") if is_encoded else e.embedding
+                for e, is_encoded in zip(data, encoded)
+            ]
+            return np.asarray(rows, dtype=np.float32)
+        return np.asarray([e.embedding for e in data], dtype=np.float32)
+
 
 class SimilarityRequest(BaseModel):
     """Similarity request for sentence/embedding similarity"""
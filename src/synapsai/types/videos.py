@@ -18,7 +18,6 @@ Video generation type definitions
 
 from enum import Enum
 from typing import Literal, Optional, Union
-from PIL import Image
 
 from pydantic import BaseModel, Field
 
@@ -16,9 +16,72 @@
 Utility functions for SynapsAI client library
 """
 
+import asyncio
+import json
+import logging
+from functools import lru_cache
+from typing import Any, Generic, Optional, Type, TypeVar, Union
+
+from pydantic import BaseModel, ValidationError
+
+from .exceptions import APIError
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup (`pip install synapsai-python[fast]`)
+    orjson = None
+
+ChunkT = TypeVar("ChunkT", bound=BaseModel)
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Response bodies above this size (in bytes) are validated in a worker thread on async clients.
+THREADED_VALIDATION_THRESHOLD = 100_000
+
+
+def json_dumps(obj: Any, sort_keys: bool = False) -> bytes:
+    """
+    Serialize an object to compact UTF-8 encoded JSON.
+
+    Uses orjson when it is installed and falls back to the standard library.
+    With `sort_keys=True` equal objects always serialize to the same bytes.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, sort_keys=sort_keys).encode("utf-8")
+
+
+def json_loads(data: Union[bytes, bytearray, str]) -> Any:
+    """
+    Deserialize JSON from bytes or str.
+
+    Uses orjson when it is installed and falls back to the standard library.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+async def avalidate_json(model_cls: Type[ModelT], content: bytes) -> ModelT:
+    """
+    Validate a JSON response body as `model_cls` without stalling the event loop.
+
+    Large bodies (e.g. `n > 1` long completions) are validated in a worker thread so other
+    coroutines keep running; small ones are validated inline, where a thread hop would cost more.
+    """
+    if len(content) > THREADED_VALIDATION_THRESHOLD:
+        return await asyncio.to_thread(model_cls.model_validate_json, content)
+    return model_cls.model_validate_json(content)
+
+
+@lru_cache(maxsize=256)
 def build_url(base: str, endpoint: str) -> str:
     """
     Build a URL from a base URL and an endpoint.
+
+    Results are memoized since clients build the same few URLs on every call.
     
     Args:
         base: Base URL.
@@ -29,4 +92,59 @@ def build_url(base: str, endpoint: str) -> str:
     """
     base = base.rstrip("/")
     endpoint = endpoint.lstrip("/")
-    return f"{base}/{endpoint}"
\ No newline at end of file
+    return f"{base}/{endpoint}"
+
+class StreamChunkParser(Generic[ChunkT]):
+    """
+    Validate the raw event payloads of one stream as `chunk_cls`.
+
+    Server error events raise `APIError`. Other payloads that fail validation are skipped;
+    the first one is logged as a warning and the total is reported once the stream ends,
+    so a malformed stream doesn't log (or format a traceback) per event.
+
+    Example:
+        with StreamChunkParser(ChatCompletionChunk, endpoint, logger) as parse:
+            for payload in payloads:
+                chunk = parse(payload)
+    """
+
+    __slots__ = ("chunk_cls", "endpoint", "logger", "skipped")
+
+    def __init__(self, chunk_cls: Type[ChunkT], endpoint: str, logger: logging.Logger):
+        self.chunk_cls = chunk_cls
+        self.endpoint = endpoint
+        self.logger = logger
+        self.skipped = 0
+
+    def __call__(self, payload: Union[bytes, bytearray]) -> Optional[ChunkT]:
+        try:
+            # Parse and validate the raw event payload in a single pass
+            return self.chunk_cls.model_validate_json(payload)
+        except ValidationError:
+            try:
+                error = json_loads(payload).get("error")
+            except Exception:
+                error = None
+            if error:
+                raise APIError(error) from None
+            self.skipped += 1
+            if self.skipped == 1:
+                self.logger.warning(
+                    "Failed to parse %s",
+                    self.chunk_cls.__name__,
+                    exc_info=self.logger.isEnabledFor(logging.DEBUG),
+                    extra={"endpoint": self.endpoint},
+                )
+            return None
+
+    def __enter__(self) -> "StreamChunkParser[ChunkT]":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if self.skipped > 1:
+            self.logger.info(
+                "Skipped %d unparseable %s events",
+                self.skipped,
+                self.chunk_cls.__name__,
+                extra={"endpoint": self.endpoint},
+            )
@@ -0,0 +1,43 @@
+import json
+import unittest
+
+from synapsai.resources.classifications import _zero_shot_text_body
+
+
+class ZeroShotTextBodyTest(unittest.TestCase):
+    def body(self, **overrides):
+        fields = {
+            "model": "m",
+            "sequences": ["a", "b"],
+            "candidate_labels": ["x", "y"],
+            "hypothesis_template": None,
+            "multi_label": False,
+        }
+        fields.update(overrides)
+        return json.loads(_zero_shot_text_body(**fields))
+
+    def test_body(self):
+        self.assertEqual(
+            self.body(),
+            {"model": "m", "candidate_labels": ["x", "y"], "multi_label": False, "sequences": ["a", "b"]},
+        )
+
+    def test_repeated_labels_reuse_the_prefix(self):
+        self.assertEqual(self.body(sequences="c")["sequences"], "c")
+        self.assertEqual(self.body(candidate_labels=("x", "y"))["candidate_labels"], ["x", "y"])
+
+    def test_none_fields_are_omitted(self):
+        self.assertEqual(
+            self.body(sequences=None, candidate_labels=None, multi_label=None),
+            {"model": "m"},
+        )
+
+    def test_only_sequences(self):
+        self.assertEqual(
+            self.body(model=None, candidate_labels=None, multi_label=None),
+            {"sequences": ["a", "b"]},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
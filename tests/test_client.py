@@ -0,0 +1,112 @@
+import asyncio
+import unittest
+
+import httpx
+
+from synapsai import AsyncSynapsAI
+from synapsai.exceptions import APIError
+from synapsai.utils import json_dumps
+
+MODELS = {"object": "list", "data": [{"id": "m", "created": 1, "owned_by": "x", "status": "ready"}]}
+
+
+class RequestCoalescingTest(unittest.IsolatedAsyncioTestCase):
+    """Identical in-flight async GET / idempotent requests share one HTTP call"""
+
+    async def asyncSetUp(self):
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.status = 200
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            self.calls += 1
+            await self.release.wait()
+            if self.status != 200:
+                return httpx.Response(self.status, json={"error": {"message": "boom"}})
+            return httpx.Response(200, json=MODELS)
+
+        self.client = AsyncSynapsAI(
+            api_key="test",
+            base_url="http://test/v1",
+            max_retries=0,
+            httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+
+    async def asyncTearDown(self):
+        await self.client.close()
+
+    async def test_concurrent_identical_requests_share_one_call(self):
+        first = asyncio.create_task(self.client.models.list())
+        second = asyncio.create_task(self.client.models.list())
+        await asyncio.sleep(0)
+        self.release.set()
+
+        results = await asyncio.gather(first, second)
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual([r.data[0].id for r in results], ["m", "m"])
+        self.assertEqual(self.client._inflight, {})
+
+    async def test_cancelling_the_first_caller_does_not_cancel_the_others(self):
+        first = asyncio.create_task(self.client._get("models"))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(self.client._get("models"))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        await asyncio.sleep(0)
+        self.release.set()
+
+        response = await second
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(first.cancelled())
+        self.assertEqual(self.calls, 1)
+
+    async def test_errors_reach_every_caller(self):
+        self.status = 401
+        first = asyncio.create_task(self.client._get("models"))
+        second = asyncio.create_task(self.client._get("models"))
+        await asyncio.sleep(0)
+        self.release.set()
+
+        results = await asyncio.gather(first, second, return_exceptions=True)
+
+        self.assertEqual(self.calls, 1)
+        for result in results:
+            self.assertIsInstance(result, APIError)
+            self.assertEqual(result.status_code, 401)
+        self.assertEqual(self.client._inflight, {})
+
+    async def test_finished_requests_are_not_reused(self):
+        self.release.set()
+        await self.client._get("models")
+        await self.client._get("models")
+
+        self.assertEqual(self.calls, 2)
+
+
+    async def test_bodies_differing_anywhere_are_not_coalesced(self):
+        self.release.set()
+        first = [0.0] * 2000
+        second = [0.0] * 1999 + [1.0]
+        keys = set()
+        for values in (first, second):
+            body = json_dumps({"input": values, "model": "m"}, sort_keys=True)
+            keys.add(await self.client._coalescing_key("POST", "embeddings", body))
+        self.assertEqual(len(keys), 2)
+
+    async def test_coalesced_body_is_serialized_once_with_sorted_keys(self):
+        self.release.set()
+        sent = []
+
+        async def send(method, endpoint, json_data=None, data=None, files=None):
+            sent.append(json_data)
+            return httpx.Response(200, json=MODELS)
+
+        self.client._send_request = send
+        await self.client._post("models", json_data={"b": 1, "a": 2}, idempotent=True)
+        self.assertEqual(sent, [b'{"a":2,"b":1}'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import base64
+import math
+import struct
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from synapsai.resources.embeddings import _cosine_similarities, _matrix_cosine_similarities
+from synapsai.types.embeddings import EmbeddingResponse
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional
+    np = None
+
+
+@mock.patch("synapsai.resources.embeddings.simsimd", None)
+class CosineSimilaritiesTest(unittest.TestCase):
+    def test_scores(self):
+        sims = _cosine_similarities([1.0, 0.0], [[1.0, 0.0], [0.0, 1.0], [-1.0, 0.0]])
+        for sim, expected in zip(sims, [1.0, 0.0, -1.0]):
+            self.assertAlmostEqual(sim, expected, places=5)
+
+    def test_zero_source_scores_zero(self):
+        self.assertEqual(_cosine_similarities([0.0, 0.0], [[0.0, 0.0], [1.0, 2.0]]), [0.0, 0.0])
+
+    def test_zero_candidate_scores_zero(self):
+        sims = _cosine_similarities([1.0, 2.0], [[0.0, 0.0], [1.0, 2.0]])
+        self.assertEqual(sims[0], 0.0)
+        self.assertAlmostEqual(sims[1], 1.0, places=5)
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_matrix_variant_matches(self):
+        source = np.asarray([1.0, 2.0, 0.0], dtype=np.float32)
+        others = np.asarray([[0.0, 0.0, 0.0], [1.0, 2.0, 0.0], [2.0, -1.0, 3.0]], dtype=np.float32)
+        expected = _cosine_similarities(source.tolist(), others.tolist())
+        for sim, want in zip(_matrix_cosine_similarities(np, source, others), expected):
+            self.assertAlmostEqual(sim, want, places=5)
+
+        zero = np.zeros(3, dtype=np.float32)
+        self.assertEqual(_matrix_cosine_similarities(np, zero, others), [0.0, 0.0, 0.0])
+
+
+def stub_cosine_distance(a, b):
+    """SimSIMD-style cosine distance, including its 0.0 distance between two zero vectors"""
+    dot = sum(x * y for x, y in zip(a, b))
+    norms = math.sqrt(sum(x * x for x in a) * sum(y * y for y in b))
+    if not norms:
+        return 0.0 if not any(a) and not any(b) else 1.0
+    return 1.0 - dot / norms
+
+
+@mock.patch("synapsai.resources.embeddings.simsimd", SimpleNamespace(cosine=stub_cosine_distance))
+class SimSIMDCosineSimilaritiesTest(unittest.TestCase):
+    def test_scores(self):
+        sims = _cosine_similarities([1.0, 0.0], [[1.0, 0.0], [0.0, 1.0], [-1.0, 0.0]])
+        for sim, expected in zip(sims, [1.0, 0.0, -1.0]):
+            self.assertAlmostEqual(sim, expected, places=5)
+
+    def test_zero_source_scores_zero(self):
+        self.assertEqual(_cosine_similarities([0.0, 0.0], [[0.0, 0.0], [1.0, 2.0]]), [0.0, 0.0])
+
+    def test_zero_candidate_scores_zero(self):
+        sims = _cosine_similarities([1.0, 2.0], [[0.0, 0.0], [1.0, 2.0]])
+        self.assertEqual(sims[0], 0.0)
+        self.assertAlmostEqual(sims[1], 1.0, places=5)
+
+
+def encode(vector):
+    return base64.b64encode(struct.pack(f"<{len(vector)}f", *vector)).decode("ascii")
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class EmbeddingResponseMatrixTest(unittest.TestCase):
+    def matrix(self, embeddings):
+        data = [{"embedding": e, "index": i} for i, e in reversed(list(enumerate(embeddings)))]
+        return EmbeddingResponse(data=data, model="m").matrix
+
+    def test_float_rows(self):
+        self.assertEqual(self.matrix([[1.0, 2.0], [3.0, 4.0]]).tolist(), [[1.0, 2.0], [3.0, 4.0]])
+
+    def test_base64_rows(self):
+        matrix = self.matrix([encode([1.0, 2.0]), encode([3.0, 4.0])])
+        self.assertEqual(matrix.dtype, np.float32)
+        self.assertEqual(matrix.tolist(), [[1.0, 2.0], [3.0, 4.0]])
+
+    def test_mixed_rows(self):
+        matrix = self.matrix([[1.0, 2.0], encode([3.0, 4.0]), [5.0, 6.0]])
+        self.assertEqual(matrix.dtype, np.float32)
+        self.assertEqual(matrix.tolist(), [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]])
+
+
+if __name__ == "__main__":
+    unittest.main()
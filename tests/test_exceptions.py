@@ -0,0 +1,21 @@
+import pickle
+import unittest
+
+from synapsai.exceptions import APIError, AuthenticationError, RateLimitError
+
+
+class ExceptionPicklingTest(unittest.TestCase):
+    def test_api_errors_round_trip(self):
+        for cls in (APIError, AuthenticationError, RateLimitError):
+            error = cls("bad key", status_code=401, response_data={"error": {"message": "bad key"}})
+            restored = pickle.loads(pickle.dumps(error))
+
+            self.assertIs(type(restored), cls)
+            self.assertEqual(str(restored), "bad key")
+            self.assertEqual(restored.message, "bad key")
+            self.assertEqual(restored.status_code, 401)
+            self.assertEqual(restored.response_data, {"error": {"message": "bad key"}})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import asyncio
+import unittest
+from unittest import mock
+
+import httpx
+
+from synapsai import AsyncSynapsAI
+
+DETECTIONS = {"object": "list", "model": "m", "data": [{"label": "cat", "score": 0.9}]}
+
+
+async def run_inline(func, *args, **kwargs):
+    return func(*args, **kwargs)
+
+
+class AsyncImageAnalysisCoalescingTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        # Encode inputs inline so every caller reaches the transport (or the shared in-flight
+        # request) within its first step instead of after a worker thread finishes
+        patcher = mock.patch("asyncio.to_thread", run_inline)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.calls = []
+        self.release = asyncio.Event()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            self.calls.append(request.url.path)
+            await self.release.wait()
+            if request.url.path.endswith("/generations"):
+                return httpx.Response(200, json={"object": "list", "data": [{"url": "u"}]})
+            return httpx.Response(200, json=DETECTIONS)
+
+        self.client = AsyncSynapsAI(
+            api_key="test",
+            base_url="http://test/v1",
+            max_retries=0,
+            httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+
+    async def asyncTearDown(self):
+        await self.client.close()
+
+    async def wait_for_calls(self):
+        """
+        Wait until the first request reaches the transport. Tasks run their first step in
+        creation order, so by then every caller has either sent or joined a request.
+        """
+        while not self.calls:
+            await asyncio.sleep(0)
+
+    async def test_identical_concurrent_detections_share_one_request(self):
+        tasks = [
+            asyncio.create_task(self.client.images.object_detection(model="m", inputs="http://x/cat.png"))
+            for _ in range(2)
+        ]
+        await self.wait_for_calls()
+        self.release.set()
+
+        results = await asyncio.gather(*tasks)
+
+        self.assertEqual(self.calls, ["/v1/images/object-detection"])
+        for result in results:
+            self.assertEqual(result.data, DETECTIONS["data"])
+
+    async def test_cancelled_caller_does_not_affect_the_other(self):
+        first = asyncio.create_task(self.client.images.object_detection(model="m", inputs="http://x/cat.png"))
+        second = asyncio.create_task(self.client.images.object_detection(model="m", inputs="http://x/cat.png"))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        await self.wait_for_calls()
+        self.release.set()
+
+        result = await second
+        self.assertEqual(result.data, DETECTIONS["data"])
+        self.assertEqual(len(self.calls), 1)
+
+    async def test_different_inputs_are_not_coalesced(self):
+        tasks = [
+            asyncio.create_task(self.client.images.object_detection(model="m", inputs=f"http://x/{name}.png"))
+            for name in ("cat", "dog")
+        ]
+        await self.wait_for_calls()
+        self.release.set()
+        await asyncio.gather(*tasks)
+
+        self.assertEqual(len(self.calls), 2)
+
+    async def test_generations_are_never_coalesced(self):
+        tasks = [asyncio.create_task(self.client.images.generate(model="m", prompt="p")) for _ in range(2)]
+        await self.wait_for_calls()
+        self.release.set()
+        await asyncio.gather(*tasks)
+
+        self.assertEqual(len(self.calls), 2)
+
+
+    async def test_forwarded_options_are_part_of_the_key(self):
+        tasks = [
+            asyncio.create_task(
+                self.client.images.object_detection(
+                    model="m", inputs="http://x/cat.png", anchors=[0.0] * 1999 + [float(last)]
+                )
+            )
+            for last in (0, 1)
+        ]
+        await self.wait_for_calls()
+        self.release.set()
+        await asyncio.gather(*tasks)
+
+        self.assertEqual(len(self.calls), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
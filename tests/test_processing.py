@@ -0,0 +1,59 @@
+import os
+import tempfile
+import time
+import unittest
+
+from synapsai import processing
+from synapsai.processing import clear_file_cache, process_image_input, set_file_cache_size
+
+
+class FileCacheTest(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp()
+        os.close(fd)
+        self.write(b"first")
+
+    def tearDown(self):
+        set_file_cache_size(0)
+        os.remove(self.path)
+
+    def write(self, content):
+        with open(self.path, "wb") as f:
+            f.write(content)
+
+    def test_disabled_by_default(self):
+        process_image_input(self.path)
+        self.assertEqual(len(processing._file_cache), 0)
+
+    def test_reuses_unchanged_files(self):
+        set_file_cache_size(1024)
+        first = process_image_input(self.path)
+        self.assertIs(process_image_input(self.path), first)
+        self.assertEqual(len(processing._file_cache), 1)
+
+    def test_changed_files_are_encoded_again(self):
+        set_file_cache_size(1024)
+        process_image_input(self.path)
+        time.sleep(0.01)
+        self.write(b"second!")
+        self.assertEqual(process_image_input(self.path), "data:image/jpeg;base64,c2Vjb25kIQ==")
+
+    def test_clear_and_disable(self):
+        set_file_cache_size(1024)
+        process_image_input(self.path)
+        clear_file_cache()
+        self.assertEqual((len(processing._file_cache), processing._file_cache_chars), (0, 0))
+
+        process_image_input(self.path)
+        set_file_cache_size(0)
+        self.assertEqual((len(processing._file_cache), processing._file_cache_chars), (0, 0))
+
+    def test_size_bound(self):
+        set_file_cache_size(100)
+        self.write(b"x" * 100)
+        process_image_input(self.path)
+        self.assertEqual(len(processing._file_cache), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()